@@ -0,0 +1,5 @@
+"""Scrape doctor information from Practo into Excel
+
+Importing the package has no side effects: no browser is started and Selenium, the
+Gemini SDK and pandas are only loaded by the code paths that use them.
+"""
@@ -0,0 +1,406 @@
+"""Offline benchmark: replay saved pages through a local fixture server and time the pipeline
+
+Serves search pages assembled from saved cards and profile pages from a local HTTP
+server with injected latency, runs search -> extract_doctor_details -> contact ->
+stories -> summary -> save_to_excel against it with a stubbed Gemini client, and
+reports doctors/second, per-stage latency and peak memory. Never touches practo.com.
+
+Fixtures come from (in order of preference):
+- an HTML archive (--archive html_archive.sqlite)
+- data/ backups named {specialty}_{region}_{idx}.html, profiles in data/profiles/
+  named after the profile URL path ('/pune/doctor/dr-x' -> pune_doctor_dr-x.html)
+- generated pages (--synthetic N doctors per combination, or when data/ is missing)
+"""
+import argparse, json, os, random, re, resource, tempfile, threading, time, tracemalloc
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+
+from . import scraper
+from .browser_profile import get_browser_profile
+from .browser_session import BrowserSession
+from .doctor_index import DoctorIndex
+from .excel_export import save_to_excel
+from .gemini_service import SummaryPipeline
+from .html_archive import HtmlArchive
+from .http_fetcher import ProfileFetcher
+from .metrics import metrics
+from .page_parser import parse_search_page
+
+PRACTO_ORIGIN = "https://www.practo.com"
+
+# Cards per served search page, like the live site
+PAGE_SIZE = 10
+
+class FixtureSet:
+    """Card HTML per (specialty, region) in listing order, and profile HTML per URL path"""
+
+    def __init__(self):
+        self.cards = {}
+        self.profiles = {}
+
+    def add_card(self, specialty, region, card_html):
+        self.cards.setdefault((specialty.lower(), region.lower()), []).append(card_html)
+
+    def add_profile(self, profile_url, page_source):
+        self.profiles[urlsplit(profile_url).path] = page_source
+
+    def combinations(self):
+        return list(self.cards)
+
+    def doctor_count(self):
+        return sum(len(cards) for cards in self.cards.values())
+
+def load_data_dir(path="data"):
+    """Fixtures from the data/ card backups and data/profiles/"""
+    fixtures = FixtureSet()
+    if not os.path.isdir(path):
+        return fixtures
+
+    saved_cards = []
+    for filename in os.listdir(path):
+        match = re.fullmatch(r'(.+)_([^_]+)_(\d+)\.html', filename)
+        if match:
+            saved_cards.append((match.group(1).replace("_", " "), match.group(2), int(match.group(3)), filename))
+    for specialty, region, idx, filename in sorted(saved_cards):
+        with open(os.path.join(path, filename), encoding="utf-8") as f:
+            fixtures.add_card(specialty, region, f.read())
+
+    profiles_path = os.path.join(path, "profiles")
+    if os.path.isdir(profiles_path):
+        for filename in os.listdir(profiles_path):
+            if filename.endswith(".html"):
+                with open(os.path.join(profiles_path, filename), encoding="utf-8") as f:
+                    fixtures.profiles["/" + filename[:-len(".html")].replace("_", "/")] = f.read()
+    return fixtures
+
+def load_archive(path):
+    """Fixtures from the latest archived version of every card and its profile"""
+    fixtures = FixtureSet()
+    archive = HtmlArchive(path)
+    try:
+        for card in archive.iter_cards():
+            fixtures.add_card(card['specialty'], card['region'], card['html'])
+            if card['profile_url'] and urlsplit(card['profile_url']).path not in fixtures.profiles:
+                profile_html = archive.latest_profile(card['profile_url'])
+                if profile_html:
+                    fixtures.add_profile(card['profile_url'], profile_html)
+    finally:
+        archive.close()
+    return fixtures
+
+SYNTHETIC_STORIES = [
+    "The doctor explained the treatment clearly and was very patient with all my questions.",
+    "Excellent diagnosis, the clinic staff were friendly and the doctor was caring.",
+    "Waiting time was long and the consultation felt rushed, but the treatment worked.",
+    "Very professional doctor, highly recommend for anyone needing a second opinion.",
+    "The clinic was crowded and expensive, though the doctor was knowledgeable."
+]
+
+def synthetic_fixtures(doctors_per_combination=20, specialties=None, regions=None, seed=0):
+    """Generated cards and profiles shaped like the live pages"""
+    rng = random.Random(seed)
+    fixtures = FixtureSet()
+    for specialty in specialties or scraper.SPECIALTIES:
+        for region in regions or scraper.REGIONS:
+            for idx in range(doctors_per_combination):
+                slug = f"dr-{specialty}-{region}-{idx}".lower().replace(" ", "-")
+                profile_url = f"{PRACTO_ORIGIN}/pune/doctor/{slug}"
+                name = f"Dr. {specialty.split()[0]} {region} {idx}"
+                fixtures.add_card(specialty, region, f"""
+<div class="u-border-general--bottom"><div class="info-section">
+<h2 data-qa-id="doctor_name" class="u-jumbo-font"><a href="{profile_url}">{name}</a></h2>
+<div><span>{specialty}</span></div>
+<div>{rng.randint(3, 35)} years experience overall</div>
+<span class="u-c-pointer" data-qa-id="doctor_clinic_name">{region} Care Clinic {idx}</span>
+<span data-qa-id="practice_locality">{region}, Pune</span>
+<span class="o-label--success" data-qa-id="doctor_recommendation">{rng.randint(80, 100)}%</span>
+<span class="u-t-underline" data-qa-id="total_feedback">{rng.randint(5, 400)} Patient Stories</span>
+<a href="tel:+9120{rng.randint(10000000, 99999999)}">Call</a>
+<button data-qa-id="call_button">Contact Clinic</button>
+</div></div>""")
+                stories = "".join(
+                    f'<div data-qa-id="review-text">{story}</div>'
+                    for story in rng.sample(SYNTHETIC_STORIES, rng.randint(2, len(SYNTHETIC_STORIES)))
+                )
+                fixtures.add_profile(profile_url, f"""<html><body>
+<h1>{name}</h1>
+<p data-qa-id="clinic-address">{idx} Main Road, {region}, Pune, Maharashtra 4110{idx % 100:02d}</p>
+{stories}
+</body></html>""")
+    return fixtures
+
+class FixtureServer:
+    """Local HTTP server for a FixtureSet with latency + up to jitter seconds added to every response"""
+
+    def __init__(self, fixtures, latency=0.0, jitter=0.0, host="127.0.0.1", port=0):
+        self.fixtures = fixtures
+        self.latency = latency
+        self.jitter = jitter
+        self.requests_served = 0
+        self.lock = threading.Lock()
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.delay()
+                body = server.render(self.path)
+                self.send_response(200 if body is not None else 404)
+                body = (body or "").encode("utf-8")
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.base_url = f"http://{host}:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def delay(self):
+        with self.lock:
+            self.requests_served += 1
+        if self.latency or self.jitter:
+            time.sleep(self.latency + random.uniform(0, self.jitter))
+
+    def localize(self, page_html):
+        """Point profile links at this server so a real browser stays offline too"""
+        return page_html.replace(PRACTO_ORIGIN, self.base_url)
+
+    def render(self, path):
+        parts = urlsplit(path)
+        if parts.path == "/search/doctors":
+            return self.search_page(parse_qs(parts.query))
+        page_source = self.fixtures.profiles.get(parts.path)
+        return self.localize(page_source) if page_source is not None else None
+
+    def search_page(self, query):
+        try:
+            words = [item['word'] for item in json.loads(query['q'][0])]
+            specialty, region = words[0], words[1]
+            page = int(query.get('page', ['1'])[0])
+        except (KeyError, IndexError, TypeError, ValueError):
+            return None
+        cards = self.fixtures.cards.get((specialty.lower(), region.lower()), [])
+        page_cards = cards[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+        return self.localize("<html><body><div class='listing'>" + "".join(page_cards) + "</div></body></html>")
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+class StubResponse:
+    def __init__(self, text):
+        self.text = text
+
+class StubGeminiModel:
+    """Stands in for a Gemini model: fixed latency, canned summaries, answers batch prompts in JSON"""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def generate_content(self, prompt):
+        with self.lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        summary = "Patients value the clear explanations and caring manner.\nSome mention waiting times; overall recommended."
+        if "JSON array" in prompt:
+            doctor_ids = re.findall(r'Doctor (\d+):', prompt)
+            return StubResponse(json.dumps([{"id": int(doctor_id), "summary": summary} for doctor_id in doctor_ids]))
+        return StubResponse(summary)
+
+def iter_http_search_pages(fetcher, specialty, region, limit, max_pages):
+    """HTTP twin of scraper.iter_search_pages: same pages, parsed offline, no card elements"""
+    position = 0
+    for page in range(1, max_pages + 1):
+        if position >= limit:
+            return
+        search_url = scraper.BASE_URL.format(specialty=specialty.replace(" ", "%20"), region=region.replace(" ", "%20"), page=page)
+        with metrics.timer('search_page_load') as timer:
+            page_source = fetcher.fetch_html(search_url)
+            if not page_source:
+                timer.outcome = "empty"
+        with metrics.timer('card_extraction') as timer:
+            cards_data = parse_search_page(page_source)[:limit - position] if page_source else []
+            if not cards_data:
+                timer.outcome = "empty"
+        if not cards_data:
+            return
+        page_cards = [(position + idx, None, card_data) for idx, card_data in enumerate(cards_data)]
+        position += len(page_cards)
+        yield page_cards
+
+def run_pipeline(server, combinations, driver_mode="http", max_results=5, max_pages=10, http_concurrency=4,
+                 summary_pipeline=None, excel_path=None, browser_profile=None):
+    """Scrape every combination from the fixture server and export, returns the doctor records"""
+    fetcher = ProfileFetcher(concurrency=http_concurrency, base_url=server.base_url, retries=0)
+    doctor_index = DoctorIndex()
+    with scraper.profile_cache_lock:
+        scraper.profile_cache.clear()
+
+    driver = None
+    original_base_url = scraper.BASE_URL
+    all_doctors_data = []
+    try:
+        if driver_mode == "chrome":
+            # The real browser path: page loads, in-browser waits and the contact flow
+            scraper.BASE_URL = fetcher.rewrite_url(original_base_url)
+            scraper.rate_limiter.configure(rate=0)
+            driver = BrowserSession(
+                lambda: scraper.create_driver(headless=True, capture_network=True, profile=browser_profile),
+                prepare_tab=browser_profile.apply if browser_profile else None
+            )
+
+        pending_summaries = {}
+        for specialty, region in combinations:
+            if driver:
+                doctors_data = scraper.scrape_combination(driver, specialty, region, "html", None, None, summary_pipeline,
+                                                       None, doctor_index, max_results, max_pages, "network")
+            else:
+                doctors_data = []
+                for page_cards in iter_http_search_pages(fetcher, specialty, region, max_results, max_pages):
+                    scraper.scrape_page(None, specialty, region, page_cards, doctors_data, [], None, fetcher,
+                                     summary_pipeline, None, doctor_index, "network")
+            for position, doctor_info in enumerate(doctors_data):
+                pending_summaries[(region, specialty, position)] = doctor_info
+            all_doctors_data.extend(doctors_data)
+
+        if summary_pipeline:
+            for doctor_id, summary in summary_pipeline.join().items():
+                pending_summaries[doctor_id]['summary_pros_cons'] = summary
+
+        save_to_excel(all_doctors_data, filename=excel_path)
+    finally:
+        scraper.BASE_URL = original_base_url
+        if driver:
+            driver.quit()
+        fetcher.close()
+    return all_doctors_data
+
+def run_benchmark(fixtures, driver_mode="http", latency=0.05, jitter=0.0, gemini_latency=0.2, summary_workers=4,
+                  summary_batch_size=1, http_concurrency=4, max_results=None, max_pages=10, trace_memory=False,
+                  browser_profile=None):
+    """Run the pipeline once against a fresh fixture server and return the benchmark report"""
+    combinations = fixtures.combinations()
+    if max_results is None:
+        max_results = max((len(cards) for cards in fixtures.cards.values()), default=0)
+
+    server = FixtureServer(fixtures, latency, jitter).start()
+    model = StubGeminiModel(gemini_latency)
+    summary_pipeline = SummaryPipeline(max_in_flight=max(1, summary_workers), model_client=model,
+                                       batch_size=summary_batch_size)
+    metrics.reset()
+    if trace_memory:
+        tracemalloc.start()
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            started = time.perf_counter()
+            doctors = run_pipeline(server, combinations, driver_mode, max_results, max_pages, http_concurrency,
+                                   summary_pipeline, os.path.join(tmp, "benchmark.xlsx"), browser_profile)
+            elapsed = time.perf_counter() - started
+    finally:
+        peak_heap = tracemalloc.get_traced_memory()[1] if trace_memory else None
+        if trace_memory:
+            tracemalloc.stop()
+        summary_pipeline.close()
+        server.close()
+
+    run_report = metrics.report()
+    return {
+        'driver': driver_mode,
+        'combinations': len(combinations),
+        'doctors': len(doctors),
+        'elapsed_seconds': round(elapsed, 3),
+        'doctors_per_second': round(len(doctors) / elapsed, 3) if elapsed else None,
+        'injected_latency_seconds': latency,
+        'injected_jitter_seconds': jitter,
+        'gemini_latency_seconds': gemini_latency,
+        'gemini_calls': model.calls,
+        'requests_served': server.requests_served,
+        'stages': run_report['stages'],
+        'counters': run_report['counters'],
+        # ru_maxrss is in kilobytes on Linux; Chrome's own processes are not included
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        'peak_python_heap_mb': round(peak_heap / 2 ** 20, 1) if peak_heap is not None else None
+    }
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the scraper offline against a local fixture server")
+    parser.add_argument("--data", default="data",
+                        help="Directory of saved card backups, with profiles in <data>/profiles (default: data)")
+    parser.add_argument("--archive",
+                        help="Use the cards and profiles of an HTML archive instead of the data directory")
+    parser.add_argument("--synthetic", type=int,
+                        help="Generate this many doctors per specialty-region combination instead of loading fixtures")
+    parser.add_argument("--driver", choices=["http", "chrome"], default="http",
+                        help="Drive the pipeline over plain HTTP (http) or through a real headless Chrome (chrome)")
+    parser.add_argument("--browser-profile", choices=["default", "lean"], default="lean",
+                        help="Chrome launch profile in chrome mode (default: lean)")
+    parser.add_argument("--latency", type=float, default=0.05,
+                        help="Seconds added to every fixture server response (default: 0.05)")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="Up to this many random extra seconds per response (default: 0)")
+    parser.add_argument("--gemini-latency", type=float, default=0.2,
+                        help="Seconds the stub Gemini client takes per request (default: 0.2)")
+    parser.add_argument("--summary-workers", type=int, default=4,
+                        help="Concurrent stub Gemini requests (default: 4)")
+    parser.add_argument("--summary-batch-size", type=int, default=1,
+                        help="Doctors per stub Gemini request (default: 1)")
+    parser.add_argument("--http-concurrency", type=int, default=4,
+                        help="Concurrent profile requests (default: 4)")
+    parser.add_argument("--max-results", type=int,
+                        help="Doctors per combination (default: every fixture card)")
+    parser.add_argument("--max-pages", type=int, default=10,
+                        help="Result pages to walk at most per combination (default: 10)")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="Also report the peak Python heap via tracemalloc (slows the run down)")
+    parser.add_argument("--output",
+                        help="Write the JSON report to this file as well as stdout")
+    return parser.parse_args()
+
+def main_benchmark():
+    args = parse_args()
+    if args.synthetic:
+        fixtures = synthetic_fixtures(args.synthetic)
+    elif args.archive:
+        fixtures = load_archive(args.archive)
+    else:
+        fixtures = load_data_dir(args.data)
+        if not fixtures.doctor_count():
+            fixtures = synthetic_fixtures()
+
+    report = run_benchmark(
+        fixtures,
+        driver_mode=args.driver,
+        latency=args.latency,
+        jitter=args.jitter,
+        gemini_latency=args.gemini_latency,
+        summary_workers=args.summary_workers,
+        summary_batch_size=args.summary_batch_size,
+        http_concurrency=args.http_concurrency,
+        max_results=args.max_results,
+        max_pages=args.max_pages,
+        trace_memory=args.trace_memory,
+        browser_profile=get_browser_profile(args.browser_profile, headless=True)
+    )
+
+    report_json = json.dumps(report, indent=2)
+    print(report_json)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report_json)
+    return report
+
+if __name__ == "__main__":
+    main_benchmark()
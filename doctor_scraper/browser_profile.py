@@ -0,0 +1,86 @@
+import re
+
+# Heavy static resources nothing is extracted from
+BLOCKED_RESOURCE_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.mp3", "*.woff", "*.woff2", "*.ttf", "*.otf"
+]
+
+# Ads, analytics and tracking hosts loaded by the listing and profile pages
+BLOCKED_THIRD_PARTY_PATTERNS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+    "*googleadservices.com*", "*facebook.net*", "*connect.facebook.*", "*hotjar.com*", "*clarity.ms*",
+    "*branch.io*", "*nr-data.net*", "*newrelic.com*", "*moengage.com*", "*sentry.io*"
+]
+
+# Bounds for a configured window size; layouts below the minimum hide the contact buttons
+MIN_WINDOW_SIZE = (800, 600)
+MAX_WINDOW_SIZE = (1920, 1080)
+
+def parse_window_size(value):
+    """Parse 'WIDTHxHEIGHT' and clamp it to MIN_WINDOW_SIZE..MAX_WINDOW_SIZE"""
+    match = re.fullmatch(r'\s*(\d+)\s*[xX,]\s*(\d+)\s*', value or "")
+    if not match:
+        raise ValueError(f"Invalid window size: {value!r} (expected WIDTHxHEIGHT)")
+    width, height = int(match.group(1)), int(match.group(2))
+    return (min(max(width, MIN_WINDOW_SIZE[0]), MAX_WINDOW_SIZE[0]),
+            min(max(height, MIN_WINDOW_SIZE[1]), MAX_WINDOW_SIZE[1]))
+
+class BrowserProfile:
+    """Chrome launch settings: options applied before start, CDP commands applied after"""
+
+    def __init__(self, name="default", headless=False, page_load_strategy="normal", blocked_urls=None,
+                 disable_extensions=False, window_size=None):
+        self.name = name
+        self.headless = headless
+        self.page_load_strategy = page_load_strategy
+        self.blocked_urls = list(blocked_urls or [])
+        self.disable_extensions = disable_extensions
+        self.window_size = window_size
+
+    def chrome_options(self, options):
+        """Add this profile's settings to a ChromeOptions instance"""
+        if self.headless:
+            options.add_argument("--headless=new")
+        # eager returns once the DOM is parsed instead of waiting for every subresource
+        options.page_load_strategy = self.page_load_strategy
+        if self.disable_extensions:
+            options.add_argument("--disable-extensions")
+            options.add_argument("--disable-component-extensions-with-background-pages")
+        if self.window_size:
+            options.add_argument(f"--window-size={self.window_size[0]},{self.window_size[1]}")
+        return options
+
+    def apply(self, driver):
+        """Settings that can only be made on a running session"""
+        if self.blocked_urls:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+
+def lean_profile(window_size=(1280, 900)):
+    """Headless, eager loads, no images/media/fonts/trackers, no extensions"""
+    return BrowserProfile(
+        name="lean",
+        headless=True,
+        page_load_strategy="eager",
+        blocked_urls=BLOCKED_RESOURCE_PATTERNS + BLOCKED_THIRD_PARTY_PATTERNS,
+        disable_extensions=True,
+        window_size=window_size
+    )
+
+def default_profile(window_size=None):
+    """Chrome's defaults, as before profiles existed"""
+    return BrowserProfile(name="default", window_size=window_size)
+
+PROFILES = {
+    'default': default_profile,
+    'lean': lean_profile
+}
+
+def get_browser_profile(name="default", window_size=None, headless=False):
+    """Build a named profile; an explicit window size replaces the profile's own, headless can only be turned on"""
+    if name not in PROFILES:
+        raise ValueError(f"Unknown browser profile: {name}")
+    profile = PROFILES[name](window_size) if window_size else PROFILES[name]()
+    profile.headless = profile.headless or headless
+    return profile
@@ -0,0 +1,132 @@
+"""Long-lived Chrome sessions: one persistent profile tab and periodic restarts"""
+import os
+
+from selenium.common.exceptions import WebDriverException
+
+from .metrics import metrics
+
+def process_tree_rss_mb(pid):
+    """Resident memory of a process and all its descendants in MB, None where /proc is unavailable"""
+    try:
+        children = {}
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    # The command name may contain spaces, fields after it are fixed
+                    ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            children.setdefault(ppid, []).append(int(entry))
+    except OSError:
+        return None
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, []))
+        try:
+            with open(f"/proc/{current}/statm") as f:
+                total += int(f.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            continue
+    return total / (1024 * 1024)
+
+class BrowserSession:
+    """A WebDriver that restarts itself every `max_pages` page loads or past `max_rss_mb` of Chrome memory
+
+    Unknown attributes are forwarded to the current driver, so a session goes wherever a driver
+    does. Restarts only happen when the next search page is requested (nothing of the old page is
+    still referenced then), so the page is simply loaded in the fresh browser. A browser that
+    crashes while loading a search page is replaced and the same page loaded again.
+    Profiles are read in one tab kept open for the whole session instead of a tab per doctor.
+    """
+
+    def __init__(self, create, prepare_tab=None, max_pages=200, max_rss_mb=None):
+        self.create = create
+        self.prepare_tab = prepare_tab
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.driver = None
+        self.restarts = 0
+        self.start()
+
+    def __getattr__(self, name):
+        # Only reached for attributes the session itself does not define
+        driver = self.__dict__.get('driver')
+        if driver is None:
+            raise AttributeError(name)
+        return getattr(driver, name)
+
+    def start(self):
+        self.driver = self.create()
+        self.search_window = self.driver.current_window_handle
+        self.profile_window = None
+        self.pages = 0
+
+    def quit(self):
+        if self.driver is None:
+            return
+        try:
+            self.driver.quit()
+        except Exception as e:
+            pass
+        self.driver = None
+
+    def restart(self):
+        """Replace the driver with a fresh one"""
+        self.quit()
+        self.start()
+        self.restarts += 1
+        metrics.count('driver_restarts')
+
+    def is_alive(self):
+        try:
+            self.driver.current_window_handle
+            return True
+        except Exception as e:
+            return False
+
+    def rss_mb(self):
+        service = getattr(self.driver, 'service', None)
+        process = getattr(service, 'process', None)
+        return process_tree_rss_mb(process.pid) if process else None
+
+    def needs_restart(self):
+        if self.max_pages and self.pages >= self.max_pages:
+            return True
+        if self.max_rss_mb:
+            rss = self.rss_mb()
+            return rss is not None and rss > self.max_rss_mb
+        return False
+
+    def get(self, url):
+        """Load a search page in the search window, restarting the browser first when it is due"""
+        if self.needs_restart():
+            self.restart()
+        self.driver.switch_to.window(self.search_window)
+        self.pages += 1
+        try:
+            self.driver.get(url)
+        except WebDriverException:
+            if self.is_alive():
+                raise
+            # Chrome died (e.g. out of memory), carry on from the same page in a fresh browser
+            self.restart()
+            self.driver.get(url)
+
+    def open_profile(self, url):
+        """Navigate the persistent profile tab to url and leave it focused"""
+        if self.profile_window not in self.driver.window_handles:
+            self.driver.switch_to.new_window('tab')
+            self.profile_window = self.driver.current_window_handle
+            # CDP settings such as blocked URLs are per tab
+            if self.prepare_tab:
+                self.prepare_tab(self.driver)
+        else:
+            self.driver.switch_to.window(self.profile_window)
+        self.pages += 1
+        self.driver.get(url)
@@ -0,0 +1,300 @@
+"""Command line entry point: crawl, summarize, export, replay and extract subcommands
+
+Heavy dependencies are imported by the subcommands that need them: Selenium only by
+crawl, the Gemini SDK only when a summary is actually requested, pandas only on export.
+"""
+import argparse, json, os, sys
+
+from .metrics import metrics
+
+COMMANDS = ["crawl", "summarize", "export", "replay", "extract"]
+
+def add_summary_arguments(parser):
+    parser.add_argument("--summary-workers", type=int, default=4,
+                        help="Concurrent Gemini requests running alongside the scraper, 0 summarizes inline (default: 4)")
+    parser.add_argument("--summary-cache", default="summary_cache.sqlite",
+                        help="SQLite file caching summaries across runs, empty string disables (default: summary_cache.sqlite)")
+    parser.add_argument("--summary-batch-size", type=int, default=1,
+                        help="Doctors packed into one Gemini request with JSON output (default: 1)")
+    parser.add_argument("--summary-tier-margin", type=float,
+                        help="Only call Gemini for doctors whose local sentiment balance is below this margin (0-1)")
+
+def add_export_arguments(parser):
+    parser.add_argument("--excel", default="pune_doctors_sheet.xlsx",
+                        help="Excel file receiving the validated records (default: pune_doctors_sheet.xlsx)")
+    parser.add_argument("--stream-export", action="append", choices=["xlsx", "csv", "parquet"], default=[],
+                        help="Also append validated rows to pune_doctors_stream.<format> as they are produced (repeatable)")
+
+def add_run_arguments(parser):
+    parser.add_argument("--archive", default="html_archive.sqlite",
+                        help="Compressed archive of every card and profile page (default: html_archive.sqlite)")
+    parser.add_argument("--selector-stats", default="selector_stats.json",
+                        help="JSON file persisting per-strategy selector hit counts across runs (default: selector_stats.json)")
+    parser.add_argument("--metrics-report", default="run_report.json",
+                        help="JSON report of per-stage timings (p50/p95), outcomes and per-field empty rates "
+                             "(default: run_report.json, empty string disables)")
+    parser.add_argument("--metrics-textfile",
+                        help="Also write the report as a Prometheus textfile (e.g. for node_exporter's textfile collector)")
+
+def add_crawl_arguments(parser):
+    from .browser_profile import parse_window_size, PROFILES
+
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of parallel Chrome sessions, all sharing the per-host --rate; raise --rate "
+                             "with it or the workers mostly wait (default: 1)")
+    parser.add_argument("--headless", action="store_true",
+                        help="Run Chrome without a visible window (implied when --workers > 1)")
+    parser.add_argument("--rate", type=float, default=0.5,
+                        help="Maximum page requests per second per host, shared by all workers and by search and "
+                             "profile pages, 0 disables limiting (default: 0.5)")
+    parser.add_argument("--burst", type=int, default=1,
+                        help="Requests allowed back-to-back before the rate applies (default: 1)")
+    parser.add_argument("--jitter", type=float, default=0.5,
+                        help="Maximum random extra delay in seconds added to each request (default: 0.5)")
+    parser.add_argument("--state", default="crawl_state.sqlite",
+                        help="SQLite file recording crawl progress (default: crawl_state.sqlite)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip combinations finished by a previous run and reuse its records")
+    parser.add_argument("--profile-fetch", choices=["browser", "http"], default="browser",
+                        help="Load profile pages in a Chrome tab (browser) or with a pooled HTTP client (http)")
+    parser.add_argument("--http-concurrency", type=int, default=4,
+                        help="Concurrent profile requests in http mode (default: 4)")
+    parser.add_argument("--profile-base-url",
+                        help="Serve profile pages from this host instead of practo.com in http mode (e.g. a local fixture server)")
+    parser.add_argument("--max-results", type=int, default=5,
+                        help="Doctors to process per specialty-region combination (default: 5)")
+    parser.add_argument("--max-pages", type=int, default=10,
+                        help="Result pages to walk at most per combination (default: 10)")
+    parser.add_argument("--contact-mode", choices=["click", "network"], default="click",
+                        help="Read phone numbers after a scroll-click-wait (click) or from embedded data and the "
+                             "captured contact XHR via DevTools logs, clicking only as a fallback (network)")
+    parser.add_argument("--browser-profile", choices=sorted(PROFILES), default="default",
+                        help="Chrome launch profile: Chrome defaults (default) or headless with eager page loads and "
+                             "blocked images, media, fonts and tracker hosts (lean)")
+    parser.add_argument("--window-size", type=parse_window_size,
+                        help="Chrome window size as WIDTHxHEIGHT, clamped to 800x600..1920x1080")
+    parser.add_argument("--recycle-pages", type=int, default=200,
+                        help="Restart each worker's Chrome after this many page loads, 0 never (default: 200)")
+    parser.add_argument("--recycle-rss-mb", type=float,
+                        help="Also restart Chrome once its processes use more than this much resident memory (MB)")
+    parser.add_argument("--engine", choices=["html", "js"], default="html",
+                        help="Card extraction engine: parse page_source offline (html) or serialize cards in the browser (js)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Reuse doctors whose card is unchanged since the last run (no profile fetch, click or summary)")
+    parser.add_argument("--change-report", default="change_report.json",
+                        help="JSON report of new, changed and removed doctors in incremental runs (default: change_report.json)")
+    parser.add_argument("--selector-report", action="store_true",
+                        help="Print the per-field selector success report and exit")
+    # Kept so `python main.py --replay` keeps working, `replay` is the subcommand
+    parser.add_argument("--replay", action="store_true", help=argparse.SUPPRESS)
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="doctor-scraper", description="Scrape doctor information from Practo")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    crawl = subparsers.add_parser("crawl", help="Scrape every specialty-region combination with Chrome")
+    add_crawl_arguments(crawl)
+    add_summary_arguments(crawl)
+    add_export_arguments(crawl)
+    add_run_arguments(crawl)
+    crawl.set_defaults(handler=crawl_command)
+
+    summarize = subparsers.add_parser("summarize", help="Generate the summaries missing from the crawl state")
+    summarize.add_argument("--state", default="crawl_state.sqlite",
+                           help="SQLite file holding the crawled records (default: crawl_state.sqlite)")
+    summarize.add_argument("--archive", default="html_archive.sqlite",
+                           help="Archive read for profiles missing from the crawl state (default: html_archive.sqlite)")
+    add_summary_arguments(summarize)
+    summarize.set_defaults(handler=summarize_command)
+
+    export = subparsers.add_parser("export", help="Write the records of the crawl state to Excel and stream formats")
+    export.add_argument("--state", default="crawl_state.sqlite",
+                        help="SQLite file holding the crawled records (default: crawl_state.sqlite)")
+    add_export_arguments(export)
+    export.set_defaults(handler=export_command)
+
+    replay = subparsers.add_parser("replay", help="Re-run extraction and export from the HTML archive, no browser")
+    add_summary_arguments(replay)
+    add_export_arguments(replay)
+    add_run_arguments(replay)
+    replay.set_defaults(handler=replay_command)
+
+    extract = subparsers.add_parser("extract", help="Re-extract the whole archive across a process pool into stream exports")
+    extract.add_argument("--processes", type=int,
+                         help="Worker processes (default: one per CPU core)")
+    extract.add_argument("--chunk-size", type=int, default=200,
+                         help="Archived cards handed to a worker at a time (default: 200)")
+    extract.add_argument("--stream-export", action="append", choices=["xlsx", "csv", "parquet"], default=[],
+                         help="Formats written to pune_doctors_stream.<format> (repeatable, default: csv)")
+    add_run_arguments(extract)
+    extract.set_defaults(handler=extract_command)
+    return parser
+
+def export_records(args, records, exporter=None):
+    """Stream (unless already streamed) and save the records to Excel"""
+    from .excel_export import save_to_excel
+
+    if exporter:
+        for doctor_info in records:
+            exporter.append(doctor_info)
+    return save_to_excel(records, filename=args.excel)
+
+def create_stream_exporter(args):
+    from .excel_export import create_exporter
+
+    return create_exporter(args.stream_export, basename="pune_doctors_stream") if args.stream_export else None
+
+def finish_run(args, records):
+    """Persist selector stats and write the metrics reports of a crawl or replay"""
+    from .excel_export import COLUMNS_ORDER
+    from .selector_registry import registry
+
+    registry.save(args.selector_stats)
+
+    # Empty rates are taken before validation so silently broken fields show up
+    metrics.record_fields(records, COLUMNS_ORDER)
+    metrics.write_json(args.metrics_report)
+    metrics.write_prometheus(args.metrics_textfile)
+
+def crawl_command(args):
+    if args.replay:
+        return replay_command(args)
+
+    from .selector_registry import registry
+    from .browser_profile import get_browser_profile
+    from .html_archive import HtmlArchive
+    from . import scraper
+
+    # Strategy order adapts to what worked in earlier runs
+    registry.load(args.selector_stats)
+    if args.selector_report:
+        print(json.dumps(registry.report(), indent=2))
+        return None
+
+    headless = args.headless or args.workers > 1
+    scraper.rate_limiter.configure(rate=args.rate, burst=args.burst, jitter=args.jitter)
+
+    exporter = create_stream_exporter(args)
+    scraper.html_archive = HtmlArchive(args.archive)
+    all_doctors_data = []
+
+    try:
+        # Rows are streamed while crawling, only the Excel file is written at the end
+        all_doctors_data = scraper.run_crawl(
+            workers=args.workers,
+            headless=headless,
+            engine=args.engine,
+            state_path=args.state,
+            resume=args.resume,
+            profile_fetch=args.profile_fetch,
+            http_concurrency=args.http_concurrency,
+            profile_base_url=args.profile_base_url,
+            summary_workers=args.summary_workers,
+            summary_cache_path=args.summary_cache,
+            summary_batch_size=args.summary_batch_size,
+            summary_tier_margin=args.summary_tier_margin,
+            exporter=exporter,
+            max_results=args.max_results,
+            max_pages=args.max_pages,
+            contact_mode=args.contact_mode,
+            browser_profile=get_browser_profile(args.browser_profile, args.window_size, headless),
+            incremental=args.incremental,
+            change_report_path=args.change_report,
+            recycle_pages=args.recycle_pages,
+            recycle_rss_mb=args.recycle_rss_mb
+        )
+        return export_records(args, all_doctors_data)
+    finally:
+        if exporter:
+            exporter.close()
+        scraper.html_archive.close()
+        scraper.html_archive = None
+        finish_run(args, all_doctors_data)
+
+def replay_command(args):
+    from .selector_registry import registry
+    from .html_archive import HtmlArchive
+    from .offline import replay_archive
+
+    registry.load(args.selector_stats)
+    exporter = create_stream_exporter(args)
+    archive = HtmlArchive(args.archive)
+    all_doctors_data = []
+
+    try:
+        all_doctors_data = replay_archive(archive, args.summary_workers, args.summary_cache)
+        return export_records(args, all_doctors_data, exporter)
+    finally:
+        if exporter:
+            exporter.close()
+        archive.close()
+        finish_run(args, all_doctors_data)
+
+def require_state(path):
+    """Stop with an error instead of letting CrawlState create an empty file at a mistyped path"""
+    if not os.path.exists(path):
+        raise SystemExit(f"No crawl state at {path}, run `crawl` first or pass --state")
+
+def summarize_command(args):
+    from .html_archive import HtmlArchive
+    from .offline import summarize_state
+
+    require_state(args.state)
+    archive = HtmlArchive(args.archive) if args.archive and os.path.exists(args.archive) else None
+    try:
+        updated = summarize_state(args.state, archive, args.summary_workers, args.summary_cache,
+                                  args.summary_batch_size, args.summary_tier_margin)
+    finally:
+        if archive:
+            archive.close()
+    print(f"Summarized {len(updated)} records in {args.state}")
+    return updated
+
+def export_command(args):
+    from .crawl_state import CrawlState
+
+    require_state(args.state)
+    state = CrawlState(args.state)
+    try:
+        records = state.load_doctors()
+    finally:
+        state.close()
+    if not records:
+        raise SystemExit(f"No records in {args.state}, nothing to export")
+
+    exporter = create_stream_exporter(args)
+    try:
+        return export_records(args, records, exporter)
+    finally:
+        if exporter:
+            exporter.close()
+
+def extract_command(args):
+    from .selector_registry import registry
+    from .html_archive import HtmlArchive
+    from .excel_export import create_exporter
+    from .offline import bulk_extract
+
+    # Workers load the stats themselves; the parent saves them at the end, so it needs them too
+    registry.load(args.selector_stats)
+    # Summaries come from the local lexicon; `summarize` or `replay` add Gemini ones
+    exporter = create_exporter(args.stream_export or ["csv"], basename="pune_doctors_stream")
+    archive = HtmlArchive(args.archive)
+    try:
+        extracted = bulk_extract(archive, exporter, args.processes, args.chunk_size, args.selector_stats)
+    finally:
+        exporter.close()
+        archive.close()
+        finish_run(args, [])
+    print(f"Extracted {extracted} records, {exporter.rows_written} written to pune_doctors_stream")
+    return extracted
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+
+    # Without a subcommand, behave like the original script and crawl
+    if not argv or (argv[0] not in COMMANDS and argv[0] not in ("-h", "--help")):
+        argv = ["crawl"] + argv
+
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
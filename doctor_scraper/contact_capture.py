@@ -0,0 +1,102 @@
+import base64, json, re, time
+
+# Indian phone numbers as shown on Practo, optionally with a +91 prefix
+PHONE_PATTERN = re.compile(r'(?:\+91[\s-]?)?\d[\d\s-]{8,14}\d')
+
+# XHR/fetch endpoints that may carry the clinic's contact number
+CONTACT_URL_PATTERN = re.compile(r'contact|phone|vn_number|virtual[_-]?number|click[_-]?to[_-]?call', re.IGNORECASE)
+
+# JSON keys whose value is a phone number in contact responses
+PHONE_KEYS = ('vn_number', 'virtual_number', 'phone_number', 'phone', 'mobile', 'contact_number', 'number')
+
+def find_phone(text):
+    """First phone-number-looking string in text with 10 to 12 digits, or ''"""
+    for match in PHONE_PATTERN.finditer(text or ""):
+        phone_number = match.group(0).strip()
+        # Longer digit runs are ids or timestamps, not numbers
+        if 10 <= len(re.sub(r'\D', '', phone_number)) <= 12:
+            return phone_number
+    return ""
+
+def first_phone(candidates):
+    """First phone number found in any single candidate text, each checked on its own, or ''"""
+    for candidate in candidates:
+        phone_number = find_phone(candidate)
+        if phone_number:
+            return phone_number
+    return ""
+
+def find_phone_in_json(body):
+    """Phone number from the phone-named keys of a JSON response body, shallowest first, or ''
+
+    Other values (request ids, doctor ids, timestamps) are never scanned.
+    """
+    try:
+        pending = [json.loads(body)]
+    except (TypeError, ValueError):
+        return ""
+    while pending:
+        value = pending.pop(0)
+        if isinstance(value, dict):
+            for key, item in value.items():
+                if str(key).lower() in PHONE_KEYS and isinstance(item, (str, int)) and not isinstance(item, bool):
+                    phone_number = find_phone(str(item))
+                    if phone_number:
+                        return phone_number
+            pending.extend(item for item in value.values() if isinstance(item, (dict, list)))
+        elif isinstance(value, list):
+            pending.extend(item for item in value if isinstance(item, (dict, list)))
+    return ""
+
+def enable_network_capture(driver):
+    """Turn on the CDP Network domain so response bodies can be read back"""
+    driver.execute_cdp_cmd("Network.enable", {})
+
+def drain_performance_log(driver):
+    """Read (and thereby clear) the pending Chrome performance log entries as CDP messages"""
+    messages = []
+    for entry in driver.get_log("performance"):
+        try:
+            messages.append(json.loads(entry["message"])["message"])
+        except (KeyError, ValueError):
+            continue
+    return messages
+
+def finished_contact_responses(messages, pending):
+    """Request ids of contact XHR/fetch responses whose body has finished loading
+
+    pending holds the ids of contact responses seen so far and is updated in place, so a body
+    still loading when its responseReceived arrives is read once loadingFinished does.
+    """
+    finished = []
+    for message in messages:
+        method = message.get("method")
+        params = message.get("params", {})
+        if method == "Network.responseReceived":
+            if params.get("type") in ("XHR", "Fetch") and CONTACT_URL_PATTERN.search(params.get("response", {}).get("url", "")):
+                pending.add(params["requestId"])
+        elif method == "Network.loadingFinished" and params.get("requestId") in pending:
+            pending.discard(params["requestId"])
+            finished.append(params["requestId"])
+        elif method == "Network.loadingFailed":
+            pending.discard(params.get("requestId"))
+    return finished
+
+def capture_contact_number(driver, timeout=5, poll_interval=0.2):
+    """Wait for a contact XHR triggered by a click and read the number from its response body"""
+    deadline = time.monotonic() + timeout
+    pending = set()
+    while time.monotonic() < deadline:
+        for request_id in finished_contact_responses(drain_performance_log(driver), pending):
+            try:
+                body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+            except Exception as e:
+                continue
+            text = body.get("body", "")
+            if body.get("base64Encoded"):
+                text = base64.b64decode(text).decode("utf-8", "replace")
+            phone_number = find_phone_in_json(text)
+            if phone_number:
+                return phone_number
+        time.sleep(poll_interval)
+    return ""
@@ -0,0 +1,225 @@
+import sqlite3, json, threading, time
+
+from .doctor_index import doctor_key
+from .records import DoctorRecord
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    region TEXT NOT NULL,
+    specialty TEXT NOT NULL,
+    status TEXT NOT NULL,
+    last_error TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (region, specialty)
+);
+CREATE TABLE IF NOT EXISTS doctors (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    region TEXT NOT NULL,
+    specialty TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    profile_url TEXT,
+    doctor_key TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS listings (
+    doctor_key TEXT NOT NULL,
+    region TEXT NOT NULL,
+    specialty TEXT NOT NULL,
+    PRIMARY KEY (doctor_key, region, specialty)
+);
+CREATE TABLE IF NOT EXISTS profiles (
+    profile_url TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    doctor_key TEXT PRIMARY KEY,
+    region TEXT NOT NULL,
+    specialty TEXT NOT NULL,
+    card_fingerprint TEXT NOT NULL,
+    profile_fingerprint TEXT,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+class CrawlState:
+    """Persistent crawl progress: completed tasks, extracted records and fetched profiles
+
+    Snapshots (the last record and fingerprints of every doctor) outlive reset(), so a
+    fresh run can still reuse doctors whose card has not changed.
+    """
+
+    def __init__(self, path="crawl_state.sqlite"):
+        self.path = path
+        # Workers share one connection, every access goes through the lock
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.executescript(SCHEMA)
+
+    def reset(self):
+        """Forget all previous progress (used for a fresh, non-resumed run), snapshots are kept"""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM tasks")
+            self.conn.execute("DELETE FROM doctors")
+            self.conn.execute("DELETE FROM profiles")
+            self.conn.execute("DELETE FROM listings")
+
+    def is_task_done(self, region, specialty):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT status FROM tasks WHERE region = ? AND specialty = ?",
+                (region, specialty)
+            ).fetchone()
+        return row is not None and row[0] == "done"
+
+    def complete_task(self, region, specialty, doctors_data):
+        """Store a task's records and mark it done in a single transaction"""
+        with self.lock, self.conn:
+            # A retried task replaces whatever a previous attempt left behind
+            self.conn.execute(
+                "DELETE FROM doctors WHERE region = ? AND specialty = ?",
+                (region, specialty)
+            )
+            self.conn.executemany(
+                "INSERT INTO doctors (region, specialty, position, profile_url, doctor_key, data) VALUES (?, ?, ?, ?, ?, ?)",
+                [(region, specialty, position, doctor_info.get('profile_url', ''),
+                  doctor_key(doctor_info.get('profile_url', ''), doctor_info.get('doctors_name', ''), doctor_info.get('clinic_hospital', '')),
+                  json.dumps(dict(doctor_info)))
+                 for position, doctor_info in enumerate(doctors_data)]
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO tasks (region, specialty, status, last_error, updated_at) VALUES (?, ?, 'done', NULL, ?)",
+                (region, specialty, time.time())
+            )
+
+    def fail_task(self, region, specialty, error):
+        """Record a failed task so a resumed run retries it"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO tasks (region, specialty, status, last_error, updated_at) VALUES (?, ?, 'failed', ?, ?)",
+                (region, specialty, repr(error), time.time())
+            )
+
+    def add_listing(self, key, region, specialty):
+        """Record that an already scraped doctor is also listed under region/specialty"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR IGNORE INTO listings (doctor_key, region, specialty) VALUES (?, ?, ?)",
+                (key, region, specialty)
+            )
+
+    def doctor_keys(self):
+        """Keys of every stored doctor, used to rebuild the dedupe index on --resume"""
+        with self.lock:
+            rows = self.conn.execute("SELECT DISTINCT doctor_key FROM doctors WHERE doctor_key != ''").fetchall()
+        return [row[0] for row in rows]
+
+    def get_profile(self, profile_url):
+        """Return a previously fetched profile, or None"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT data FROM profiles WHERE profile_url = ?", (profile_url,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_profile(self, profile_url, profile):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO profiles (profile_url, data, fetched_at) VALUES (?, ?, ?)",
+                (profile_url, json.dumps(profile), time.time())
+            )
+
+    def get_snapshot(self, key):
+        """Fingerprints and record of a doctor from the last run that saw it, or None"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT card_fingerprint, profile_fingerprint, data FROM snapshots WHERE doctor_key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {'card_fingerprint': row[0], 'profile_fingerprint': row[1], 'doctor_info': DoctorRecord.from_dict(json.loads(row[2]))}
+
+    def save_snapshots(self, fingerprints):
+        """Snapshot the stored records of the doctors seen this run, fingerprints is {key: (card_fp, profile_fp)}"""
+        with self.lock, self.conn:
+            rows = self.conn.execute("SELECT doctor_key, region, specialty, data FROM doctors ORDER BY id").fetchall()
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO snapshots (doctor_key, region, specialty, card_fingerprint, profile_fingerprint, data, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(key, region, specialty, fingerprints[key][0], fingerprints[key][1], data, time.time())
+                 for key, region, specialty, data in rows if key in fingerprints]
+            )
+
+    def remove_missing_snapshots(self):
+        """Drop snapshots of doctors no longer listed under a task finished in this state
+
+        Returns the removed [(key, doctors_name)]. Failed or skipped tasks remove nothing.
+        """
+        with self.lock, self.conn:
+            rows = self.conn.execute(
+                "SELECT doctor_key, data FROM snapshots s "
+                "WHERE EXISTS (SELECT 1 FROM tasks t WHERE t.region = s.region AND t.specialty = s.specialty AND t.status = 'done') "
+                "AND doctor_key NOT IN (SELECT doctor_key FROM doctors WHERE doctor_key IS NOT NULL) "
+                "AND doctor_key NOT IN (SELECT doctor_key FROM listings)"
+            ).fetchall()
+            self.conn.executemany("DELETE FROM snapshots WHERE doctor_key = ?", [(row[0],) for row in rows])
+        return [(key, json.loads(data).get('doctors_name', '')) for key, data in rows]
+
+    def update_summaries(self, summaries):
+        """Join generated summaries back into stored records, keyed by (region, specialty, position)
+
+        Returns the updated records.
+        """
+        updated = []
+        with self.lock, self.conn:
+            for (region, specialty, position), summary in summaries.items():
+                row = self.conn.execute(
+                    "SELECT id, data FROM doctors WHERE region = ? AND specialty = ? AND position = ?",
+                    (region, specialty, position)
+                ).fetchone()
+                if row is None:
+                    continue
+                doctor_info = DoctorRecord.from_dict(json.loads(row[1]))
+                doctor_info['summary_pros_cons'] = summary
+                self.conn.execute("UPDATE doctors SET data = ? WHERE id = ?", (json.dumps(dict(doctor_info)), row[0]))
+                updated.append(doctor_info)
+        return updated
+
+    def doctors_missing_summary(self):
+        """(region, specialty, position) and profile_url of records still waiting for a summary"""
+        with self.lock:
+            rows = self.conn.execute("SELECT region, specialty, position, profile_url, data FROM doctors ORDER BY id").fetchall()
+        return [((row[0], row[1], row[2]), row[3]) for row in rows
+                if not json.loads(row[4]).get('summary_pros_cons')]
+
+    def load_doctors(self, tasks=None):
+        """All stored records, grouped in the given (region, specialty) task order if any"""
+        with self.lock:
+            rows = self.conn.execute("SELECT region, specialty, doctor_key, data FROM doctors ORDER BY id").fetchall()
+            listing_rows = self.conn.execute("SELECT doctor_key, region, specialty FROM listings").fetchall()
+
+        if tasks is not None:
+            task_order = {task: idx for idx, task in enumerate(tasks)}
+            rows.sort(key=lambda row: task_order.get((row[0], row[1]), len(task_order)))
+
+        listings = {}
+        for key, region, specialty in listing_rows:
+            listings.setdefault(key, []).append((region, specialty))
+
+        doctors = []
+        for _, _, key, data in rows:
+            doctor_info = DoctorRecord.from_dict(json.loads(data))
+            # Attach the other regions/specialties this doctor was listed under
+            if key in listings:
+                regions = [doctor_info.get('region', '')] + [region for region, _ in listings[key]]
+                specialties = [doctor_info.get('search_specialty', '')] + [specialty for _, specialty in listings[key]]
+                doctor_info['region'] = ", ".join(dict.fromkeys(region for region in regions if region))
+                doctor_info['search_specialty'] = ", ".join(dict.fromkeys(specialty for specialty in specialties if specialty))
+            doctors.append(doctor_info)
+        return doctors
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
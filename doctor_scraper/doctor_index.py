@@ -0,0 +1,43 @@
+import threading
+from urllib.parse import urlsplit, urlunsplit
+
+def canonical_profile_url(profile_url):
+    """Profile URL without query string, fragment or trailing slash, host lowercased"""
+    if not profile_url:
+        return ""
+    parts = urlsplit(profile_url.strip())
+    return urlunsplit(("https", parts.netloc.lower(), parts.path.rstrip("/"), "", ""))
+
+def doctor_key(profile_url="", doctors_name="", clinic_hospital=""):
+    """Identity of a doctor across listings: canonical profile URL, else name + clinic"""
+    canonical_url = canonical_profile_url(profile_url)
+    if canonical_url:
+        return canonical_url
+
+    name = " ".join((doctors_name or "").lower().split())
+    clinic = " ".join((clinic_hospital or "").lower().split())
+    if not name or name == "unknown":
+        return ""
+    return f"{name}|{clinic}"
+
+class DoctorIndex:
+    """Doctors already scraped (or being scraped) in this crawl, shared by all workers"""
+
+    def __init__(self, keys=()):
+        self.keys = set(key for key in keys if key)
+        self.lock = threading.Lock()
+
+    def claim(self, key):
+        """Return True if the caller should scrape this doctor, False if it is already known"""
+        if not key:
+            return True
+        with self.lock:
+            if key in self.keys:
+                return False
+            self.keys.add(key)
+            return True
+
+    def release(self, key):
+        """Forget a claim whose scrape failed so another listing can pick the doctor up"""
+        with self.lock:
+            self.keys.discard(key)
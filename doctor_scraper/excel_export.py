@@ -0,0 +1,178 @@
+import csv, threading
+
+from .doctor_index import doctor_key
+from .metrics import metrics
+from .records import FIELDS, ColumnStore
+
+# Column order of every export
+COLUMNS_ORDER = list(FIELDS)
+
+# Define required fields that must not be empty
+REQUIRED_FIELDS = ['doctors_name', 'contact_number', 'complete_address', 'specialty']
+
+# Columns combined (instead of first value wins) when duplicate doctors are merged
+LISTING_COLUMNS = ['region', 'search_specialty']
+
+def join_unique(values):
+    """Comma-join the distinct non-empty parts of already comma-joined values"""
+    parts = []
+    for value in values:
+        if isinstance(value, str):
+            parts.extend(part.strip() for part in value.split(","))
+    return ", ".join(dict.fromkeys(part for part in parts if part))
+
+def first_non_empty(values):
+    import pandas as pd
+
+    for value in values:
+        if pd.notna(value) and str(value).strip():
+            return value
+    return ''
+
+def merge_duplicates(df):
+    """Collapse rows of the same doctor (profile URL, else name + clinic) into one"""
+    import pandas as pd
+
+    def column(name):
+        return df[name].tolist() if name in df.columns else [''] * len(df)
+
+    keys = [
+        doctor_key(profile_url, name, clinic) or f"row-{idx}"
+        for idx, (profile_url, name, clinic) in enumerate(zip(column('profile_url'), column('doctors_name'), column('clinic_hospital')))
+    ]
+    if len(set(keys)) == len(keys):
+        return df
+
+    aggregations = {
+        col: join_unique if col in LISTING_COLUMNS else first_non_empty
+        for col in df.columns
+    }
+    return df.groupby(pd.Index(keys), sort=False).agg(aggregations).reset_index(drop=True)
+
+def save_to_excel(data, filename="pune_doctors_sheet.xlsx"):
+    """Save extracted data (records or a ColumnStore) to Excel file"""
+    if not data:
+        return
+
+    # The columns go to pandas as they are, already in export order
+    store = data if isinstance(data, ColumnStore) else ColumnStore.from_records(data)
+    df = merge_duplicates(store.to_pandas())
+
+    # Remove rows with missing data: required fields must not be empty or just whitespace
+    required = [field for field in REQUIRED_FIELDS if field in df.columns]
+    complete_mask = df[required].fillna('').astype(str).apply(lambda col: col.str.strip() != '').all(axis=1)
+
+    # Filter to keep only complete records
+    df_complete = df[complete_mask]
+
+    # Save only complete records
+    with metrics.timer('export_excel'):
+        df_complete.to_excel(filename, index=False)
+
+    return df_complete
+
+def is_complete(doctor_info):
+    """Check that every required field is present and not just whitespace"""
+    return all(str(doctor_info.get(field) or '').strip() for field in REQUIRED_FIELDS)
+
+class XlsxStreamWriter:
+    """Append rows to an XLSX file using openpyxl's write-only mode"""
+
+    def __init__(self, filename, columns=COLUMNS_ORDER):
+        from openpyxl import Workbook
+
+        self.filename = filename
+        self.columns = columns
+        self.workbook = Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet()
+        self.sheet.append(columns)
+
+    def write_row(self, doctor_info):
+        self.sheet.append([doctor_info.get(col, '') for col in self.columns])
+
+    def close(self):
+        # Write-only rows are streamed to a temporary file, the workbook is assembled here
+        self.workbook.save(self.filename)
+
+class CsvStreamWriter:
+    """Append rows to a CSV file, flushed per row so partial output exists mid-run"""
+
+    def __init__(self, filename, columns=COLUMNS_ORDER):
+        self.file = open(filename, "w", newline="", encoding="utf-8")
+        self.writer = csv.DictWriter(self.file, fieldnames=columns, extrasaction="ignore")
+        self.writer.writeheader()
+
+    def write_row(self, doctor_info):
+        self.writer.writerow(doctor_info)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+class ParquetStreamWriter:
+    """Append rows to a Parquet file, one row group per row_group_size rows"""
+
+    def __init__(self, filename, columns=COLUMNS_ORDER, row_group_size=1000):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.row_group_size = row_group_size
+        self.schema = pa.schema([(col, pa.string()) for col in columns])
+        self.writer = pq.ParquetWriter(filename, self.schema)
+        self.buffer = ColumnStore(columns)
+
+    def write_row(self, doctor_info):
+        self.buffer.append(doctor_info)
+        if len(self.buffer) >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        if not len(self.buffer):
+            return
+        self.writer.write_table(self.buffer.to_arrow(self.schema))
+        self.buffer.clear()
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+WRITERS = {
+    'xlsx': XlsxStreamWriter,
+    'csv': CsvStreamWriter,
+    'parquet': ParquetStreamWriter
+}
+
+class StreamingExporter:
+    """Validate rows as they are produced and append them to every configured writer"""
+
+    def __init__(self, writers):
+        self.writers = writers
+        self.lock = threading.Lock()
+        self.rows_written = 0
+        self.rows_skipped = 0
+
+    def append(self, doctor_info):
+        """Write a complete record, incomplete ones are skipped like in save_to_excel"""
+        with self.lock, metrics.timer('export_stream_row') as timer:
+            if not is_complete(doctor_info):
+                timer.outcome = "skipped"
+                self.rows_skipped += 1
+                return False
+            for writer in self.writers:
+                writer.write_row(doctor_info)
+            self.rows_written += 1
+        return True
+
+    def close(self):
+        with self.lock:
+            for writer in self.writers:
+                writer.close()
+
+def create_exporter(formats, basename="pune_doctors_sheet"):
+    """Build a StreamingExporter writing basename.<format> for each requested format"""
+    writers = []
+    for fmt in formats:
+        if fmt not in WRITERS:
+            raise ValueError(f"Unsupported export format: {fmt}")
+        writers.append(WRITERS[fmt](f"{basename}.{fmt}"))
+    return StreamingExporter(writers)
@@ -0,0 +1,65 @@
+import hashlib, json, re, threading, time
+
+# Parts of a card that change between page loads without the doctor changing
+VOLATILE_PATTERNS = [
+    re.compile(r'<script\b.*?</script>', re.IGNORECASE | re.DOTALL),
+    re.compile(r'<style\b.*?</style>', re.IGNORECASE | re.DOTALL),
+    re.compile(r'\s(?:style|id|data-(?!qa-id)[\w-]+)="[^"]*"', re.IGNORECASE)
+]
+
+def normalize_card_html(card_html):
+    """Card HTML without scripts, inline styles, ids and tracking attributes, whitespace collapsed"""
+    for pattern in VOLATILE_PATTERNS:
+        card_html = pattern.sub('', card_html or '')
+    return re.sub(r'\s+', ' ', re.sub(r'>\s+<', '><', card_html)).strip()
+
+def card_fingerprint(card_data):
+    """Hash of the normalized card HTML plus the feedback count and rating texts"""
+    feedback = card_data.get('feedback') or " ".join(card_data.get('feedback_candidates', []))
+    rating = card_data.get('rating') or " ".join(card_data.get('rating_candidates', []))
+    content = "\x00".join([normalize_card_html(card_data.get('outer_html', '')), feedback.strip(), rating.strip()])
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+def profile_fingerprint(profile):
+    """Hash of a parsed profile's address and patient stories"""
+    content = json.dumps([profile.get('complete_address', ''), profile.get('patient_stories', [])])
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+class ChangeTracker:
+    """Per-run record of which doctors are new, changed or unchanged since their last snapshot"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+        self.statuses = {}
+        self.fingerprints = {}
+        self.names = {}
+
+    def record(self, key, status, card_fp, profile_fp, doctors_name=""):
+        with self.lock:
+            self.statuses[key] = status
+            self.fingerprints[key] = (card_fp, profile_fp)
+            self.names[key] = doctors_name
+
+    def report(self, removed=None):
+        """Counts and doctor lists per status; removed is [(key, doctors_name)] from the crawl state"""
+        removed = removed or []
+        with self.lock:
+            by_status = {'new': [], 'changed': [], 'unchanged': []}
+            for key, status in self.statuses.items():
+                by_status[status].append({'doctor_key': key, 'doctors_name': self.names.get(key, '')})
+
+        return {
+            'started_at': self.started_at,
+            'counts': dict({status: len(doctors) for status, doctors in by_status.items()}, removed=len(removed)),
+            # Unchanged doctors are only counted, listing them would dwarf the rest of the report
+            'new': by_status['new'],
+            'changed': by_status['changed'],
+            'removed': [{'doctor_key': key, 'doctors_name': name} for key, name in removed]
+        }
+
+    def write_report(self, path, removed=None):
+        if not path:
+            return
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(removed), f, indent=2)
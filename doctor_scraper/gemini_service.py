@@ -0,0 +1,378 @@
+import os, threading, sqlite3, hashlib, json, time
+from concurrent.futures import ThreadPoolExecutor
+
+from .local_summarizer import summarize_batch, summarize_tiered
+from .metrics import metrics
+
+# Configure Gemini API
+GEMINI_API_KEY = os.environ.get("GEMINI_API_KEY", "")  # Replace with your actual API key
+
+# The SDK is imported and configured on first use, so runs that never call Gemini never load it
+genai = None
+genai_lock = threading.Lock()
+
+def get_genai():
+    """The configured google.generativeai module"""
+    global genai
+    with genai_lock:
+        if genai is None:
+            import google.generativeai
+            google.generativeai.configure(api_key=GEMINI_API_KEY)
+            genai = google.generativeai
+    return genai
+
+# Configure generation config for better compatibility
+generation_config = {
+    "temperature": 0.7,
+    "top_p": 0.8,
+    "top_k": 40,
+    "max_output_tokens": 2048,
+}
+
+# Try different model names - prioritize Gemini Flash
+MODEL_NAMES = ['gemini-2.5-flash']
+
+# Bump whenever build_summary_prompt changes so cached summaries are not reused
+PROMPT_VERSION = 1
+
+class SummaryCache:
+    """Disk-backed summary cache keyed by a hash of the stories, prompt version and model name
+    
+    Entries older than max_age_seconds are dropped, and the least recently used entries
+    are evicted once more than max_entries are stored.
+    """
+    
+    def __init__(self, path="summary_cache.sqlite", max_entries=10000, max_age_seconds=30 * 24 * 3600):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS summaries ("
+                "key TEXT PRIMARY KEY, summary TEXT NOT NULL, created_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+    
+    @staticmethod
+    def make_key(patient_stories, model_name):
+        """Hash of the normalized stories (as sent to the model), prompt version and model name"""
+        normalized = [" ".join(story.split()) for story in patient_stories[:10]]
+        payload = json.dumps({'stories': normalized, 'prompt_version': PROMPT_VERSION, 'model': model_name})
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    def get(self, patient_stories, model_name):
+        key = self.make_key(patient_stories, model_name)
+        now = time.time()
+        with self.lock, self.conn:
+            row = self.conn.execute(
+                "SELECT summary, created_at FROM summaries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.max_age_seconds:
+                self.misses += 1
+                return None
+            self.conn.execute("UPDATE summaries SET used_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+    
+    def put(self, patient_stories, model_name, summary):
+        key = self.make_key(patient_stories, model_name)
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, summary, created_at, used_at) VALUES (?, ?, ?, ?)",
+                (key, summary, now, now)
+            )
+            self.evict(now)
+    
+    def evict(self, now):
+        """Drop expired entries, then the least recently used ones above max_entries"""
+        self.conn.execute("DELETE FROM summaries WHERE created_at < ?", (now - self.max_age_seconds,))
+        self.conn.execute(
+            "DELETE FROM summaries WHERE key IN ("
+            "SELECT key FROM summaries ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+    
+    def stats(self):
+        with self.lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+        return {'hits': self.hits, 'misses': self.misses, 'entries': entries}
+    
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+def build_summary_prompt(patient_stories):
+    """Prepare the prompt for Gemini"""
+    stories_text = "\n\n".join([f"Story {i+1}: {story}" for i, story in enumerate(patient_stories[:10])])
+    
+    return f"""
+        Based on the following patient stories and reviews about a doctor, provide a concise 2-line paragraph summary highlighting the key pros and cons, and overall recommendation.
+
+        Patient Stories:
+        {stories_text}
+
+        Please provide exactly 2 lines as a natural paragraph (no "Line 1:" or "Line 2:" labels):
+        First line: Key strengths and positive aspects
+        Second line: Areas of concern (if any) and overall recommendation
+
+        Write as a natural flowing paragraph with just 2 lines.
+        """
+
+def get_model_clients(model_client=None, config=None):
+    """(model_name, factory) pairs to try in order"""
+    if model_client is not None:
+        return [(getattr(model_client, 'model_name', 'custom'), lambda: model_client)]
+    return [
+        (model_name, lambda model_name=model_name: get_genai().GenerativeModel(model_name, generation_config=config or generation_config))
+        for model_name in MODEL_NAMES
+    ]
+
+def generate_summary_with_gemini(patient_stories, model_client=None, cache=None):
+    """Generate a 2-line summary using Gemini API
+    
+    model_client can be any object with a generate_content(prompt) method returning
+    something with a .text attribute (e.g. a stub in tests), by default Gemini models are used.
+    With a SummaryCache, unchanged stories are answered without calling the model.
+    """
+    try:
+        if not patient_stories:
+            return "No patient stories available for summary."
+        
+        # Without an API key every request would fail, go straight to the local summary
+        if model_client is None and not GEMINI_API_KEY:
+            return create_manual_summary(patient_stories)
+        
+        prompt = build_summary_prompt(patient_stories)
+        
+        for model_name, make_model in get_model_clients(model_client):
+            if cache is not None:
+                summary = cache.get(patient_stories, model_name)
+                if summary is not None:
+                    return summary
+            
+            try:
+                with metrics.timer('gemini_call'):
+                    response = make_model().generate_content(prompt)
+                
+                summary = response.text.strip()
+                
+                # Manual fallbacks are never cached so the model is retried next time
+                if cache is not None:
+                    cache.put(patient_stories, model_name, summary)
+                
+                return summary
+                
+            except Exception as model_error:
+                continue
+        
+        # If all models fail, create a simple summary manually
+        return create_manual_summary(patient_stories)
+        
+    except Exception as e:
+        return "Summary generation failed."
+
+# Rough prompt size limit for one batched request (about 4 characters per token)
+BATCH_TOKEN_BUDGET = 6000
+
+def estimate_tokens(text):
+    return len(text) // 4 + 1
+
+def build_batch_prompt(batch):
+    """Prompt asking for a JSON array of {id, summary} for several doctors at once"""
+    doctors_text = "\n\n".join(
+        f"Doctor {item_id}:\n" + "\n".join(f"Story {i+1}: {story}" for i, story in enumerate(patient_stories[:10]))
+        for item_id, patient_stories in batch
+    )
+    
+    return f"""
+        Below are patient stories and reviews for several doctors, each introduced by "Doctor <id>:".
+        For every doctor, write a concise 2-line paragraph summary highlighting the key pros and cons, and overall recommendation.
+        First line: Key strengths and positive aspects
+        Second line: Areas of concern (if any) and overall recommendation
+
+        {doctors_text}
+
+        Respond with only a JSON array, one object per doctor: [{{"id": <id>, "summary": "<2-line summary>"}}]
+        """
+
+def pack_batches(items, token_budget=BATCH_TOKEN_BUDGET):
+    """Group (id, patient_stories) items into batches whose prompts fit the token budget"""
+    batches = []
+    current = []
+    current_tokens = estimate_tokens(build_batch_prompt([]))
+    
+    for item_id, patient_stories in items:
+        item_tokens = estimate_tokens("\n".join(patient_stories[:10])) + 20
+        if current and current_tokens + item_tokens > token_budget:
+            batches.append(current)
+            current = []
+            current_tokens = estimate_tokens(build_batch_prompt([]))
+        current.append((item_id, patient_stories))
+        current_tokens += item_tokens
+    
+    if current:
+        batches.append(current)
+    return batches
+
+def parse_batch_response(text):
+    """Parse the model's JSON array into {id: summary}, ignoring malformed entries"""
+    text = text.strip()
+    # Models sometimes wrap JSON in a markdown code fence
+    if text.startswith("```"):
+        text = text.strip("`")
+        if text.startswith("json"):
+            text = text[4:]
+    
+    try:
+        items = json.loads(text)
+    except ValueError:
+        return {}
+    
+    summaries = {}
+    if isinstance(items, list):
+        for item in items:
+            try:
+                summary = str(item['summary']).strip()
+                if summary:
+                    summaries[int(item['id'])] = summary
+            except (KeyError, TypeError, ValueError):
+                continue
+    return summaries
+
+def generate_summaries_batch(list_of_story_lists, model_client=None, cache=None, token_budget=BATCH_TOKEN_BUDGET):
+    """Summarize several doctors with as few requests as the token budget allows
+    
+    Returns one summary per story list, in order. Items missing from or malformed in the
+    batched JSON response fall back to generate_summary_with_gemini.
+    """
+    if model_client is None and not GEMINI_API_KEY:
+        return summarize_batch(list_of_story_lists)
+    
+    summaries = [None] * len(list_of_story_lists)
+    model_name, make_model = get_model_clients(model_client, dict(generation_config, response_mime_type="application/json"))[0]
+    
+    pending = []
+    for item_id, patient_stories in enumerate(list_of_story_lists):
+        if not patient_stories:
+            summaries[item_id] = "No patient stories available for summary."
+            continue
+        if cache is not None:
+            summaries[item_id] = cache.get(patient_stories, model_name)
+        if summaries[item_id] is None:
+            pending.append((item_id, patient_stories))
+    
+    for batch in pack_batches(pending, token_budget):
+        try:
+            with metrics.timer('gemini_call'):
+                response = make_model().generate_content(build_batch_prompt(batch))
+            parsed = parse_batch_response(response.text)
+        except Exception as e:
+            parsed = {}
+        if len(parsed) < len(batch):
+            metrics.count('gemini_batch_fallback', len(batch) - len(parsed))
+        
+        for item_id, patient_stories in batch:
+            if item_id in parsed:
+                summaries[item_id] = parsed[item_id]
+                if cache is not None:
+                    cache.put(patient_stories, model_name, parsed[item_id])
+            else:
+                summaries[item_id] = generate_summary_with_gemini(patient_stories, model_client, cache)
+    
+    return summaries
+
+class SummaryPipeline:
+    """Generate summaries concurrently with the scraper
+    
+    Scraping submits (doctor_id, patient_stories) and carries on; at most max_in_flight
+    model requests run at once. With batch_size > 1, submissions are grouped and sent
+    through generate_summaries_batch. With tier_margin set, doctors whose local lexicon score
+    is clear-cut get the local summary and only ambiguous ones reach the model.
+    join() waits for everything and returns {doctor_id: summary}.
+    """
+    
+    def __init__(self, max_in_flight=4, model_client=None, cache=None, batch_size=1, tier_margin=None):
+        self.model_client = model_client
+        self.cache = cache
+        self.batch_size = batch_size
+        self.tier_margin = tier_margin
+        self.executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="summary")
+        self.futures = []
+        self.pending = []
+        self.lock = threading.Lock()
+    
+    def summarize(self, list_of_story_lists):
+        if self.tier_margin is not None:
+            return summarize_tiered(list_of_story_lists, self.summarize_with_model, margin=self.tier_margin)
+        return self.summarize_with_model(list_of_story_lists)
+    
+    def summarize_with_model(self, list_of_story_lists):
+        if len(list_of_story_lists) == 1:
+            return [generate_summary_with_gemini(list_of_story_lists[0], self.model_client, self.cache)]
+        return generate_summaries_batch(list_of_story_lists, self.model_client, self.cache)
+    
+    def flush(self):
+        """Send buffered submissions as one request group (caller holds the lock)"""
+        if not self.pending:
+            return
+        doctor_ids = [doctor_id for doctor_id, _ in self.pending]
+        story_lists = [patient_stories for _, patient_stories in self.pending]
+        self.futures.append((doctor_ids, self.executor.submit(self.summarize, story_lists)))
+        self.pending = []
+    
+    def submit(self, doctor_id, patient_stories):
+        """Queue a summary request without waiting for it"""
+        with self.lock:
+            self.pending.append((doctor_id, list(patient_stories)))
+            if len(self.pending) >= self.batch_size:
+                self.flush()
+    
+    def discard(self, doctor_ids):
+        """Forget everything submitted so far for these ids, e.g. by a task attempt that is retried
+        
+        Requests that have not started are cancelled, results of running ones are dropped.
+        Submissions made after this call under the same ids are kept.
+        """
+        doctor_ids = set(doctor_ids)
+        with self.lock:
+            self.pending = [(doctor_id, stories) for doctor_id, stories in self.pending if doctor_id not in doctor_ids]
+            futures = []
+            for ids, future in self.futures:
+                # Discarded positions become None so the batch's results still line up
+                ids = [None if doctor_id in doctor_ids else doctor_id for doctor_id in ids]
+                if any(doctor_id is not None for doctor_id in ids) or not future.cancel():
+                    futures.append((ids, future))
+            self.futures = futures
+    
+    def join(self):
+        """Wait for all queued summaries and return them keyed by doctor_id"""
+        with self.lock:
+            self.flush()
+            futures = list(self.futures)
+        
+        summaries = {}
+        for doctor_ids, future in futures:
+            try:
+                results = future.result()
+            except Exception as e:
+                results = ["Summary generation failed."] * len(doctor_ids)
+            summaries.update((doctor_id, summary) for doctor_id, summary in zip(doctor_ids, results) if doctor_id is not None)
+        return summaries
+    
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+def create_manual_summary(patient_stories):
+    """Create a simple manual summary when Gemini API fails"""
+    try:
+        if not patient_stories:
+            return "No patient stories available for summary."
+        
+        return summarize_batch([patient_stories])[0]
+        
+    except Exception as e:
+        return f"Summary based on {len(patient_stories)} patient reviews."
@@ -0,0 +1,95 @@
+import sqlite3, zlib, json, threading, time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    url TEXT,
+    region TEXT,
+    specialty TEXT,
+    position INTEGER,
+    meta TEXT,
+    html BLOB NOT NULL,
+    archived_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS pages_url ON pages (kind, url);
+CREATE INDEX IF NOT EXISTS pages_listing ON pages (kind, region, specialty, position);
+"""
+
+class HtmlArchive:
+    """Append-only, zlib-compressed store of card and profile HTML
+
+    Replaces the one-file-per-card data/ backups; nothing is ever overwritten,
+    so extraction can be re-run offline from any earlier crawl.
+    """
+
+    def __init__(self, path="html_archive.sqlite", level=6):
+        self.path = path
+        self.level = level
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.executescript(SCHEMA)
+
+    def add(self, kind, html, url="", region="", specialty="", position=None, meta=None):
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO pages (kind, url, region, specialty, position, meta, html, archived_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (kind, url, region, specialty, position, json.dumps(meta or {}),
+                 zlib.compress(html.encode("utf-8"), self.level), time.time())
+            )
+
+    def add_card(self, region, specialty, position, card_html, profile_url="", meta=None):
+        """Archive a search result card; meta holds values not present in the HTML (e.g. the clicked contact number)"""
+        self.add("card", card_html, profile_url, region, specialty, position, meta)
+
+    def add_profile(self, profile_url, page_source):
+        self.add("profile", page_source, profile_url)
+
+    def latest_profile(self, profile_url, decompress=True):
+        """Most recently archived HTML for a profile URL, or None (zlib bytes with decompress=False)"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT html FROM pages WHERE kind = 'profile' AND url = ? ORDER BY id DESC LIMIT 1",
+                (profile_url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return zlib.decompress(row[0]).decode("utf-8") if decompress else row[0]
+
+    def iter_cards(self, decompress=True, batch_size=500):
+        """Latest archived version of every card listing, yielded as dicts in crawl order
+
+        With decompress=False 'html' holds the zlib bytes, e.g. to decompress in worker processes.
+        Rows are read batch_size at a time, so memory does not grow with the archive.
+        """
+        with self.lock:
+            cursor = self.conn.execute(
+                "SELECT region, specialty, position, url, meta, html, archived_at FROM pages "
+                "WHERE id IN (SELECT MAX(id) FROM pages WHERE kind = 'card' GROUP BY region, specialty, position) "
+                "ORDER BY id"
+            )
+
+        try:
+            while True:
+                with self.lock:
+                    rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                for region, specialty, position, url, meta, html, archived_at in rows:
+                    yield {
+                        'region': region,
+                        'specialty': specialty,
+                        'position': position,
+                        'profile_url': url,
+                        'meta': json.loads(meta or "{}"),
+                        'html': zlib.decompress(html).decode("utf-8") if decompress else html,
+                        'archived_at': archived_at
+                    }
+        finally:
+            with self.lock:
+                cursor.close()
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,86 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlsplit, urlunsplit
+from concurrent.futures import ThreadPoolExecutor
+
+from .page_parser import parse_profile
+from .metrics import metrics
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive"
+}
+
+class ProfileFetcher:
+    """Fetch profile pages over a pooled keep-alive HTTP session instead of a browser tab"""
+
+    def __init__(self, concurrency=4, timeout=15, base_url=None, rate_limiter=None, retries=2, archive=None):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        # Point at a local stand-in server (e.g. http://127.0.0.1:8000) to serve saved fixtures
+        self.base_url = base_url
+        self.rate_limiter = rate_limiter
+        self.archive = archive
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=concurrency,
+            pool_maxsize=concurrency,
+            max_retries=Retry(total=retries, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def rewrite_url(self, url):
+        """Swap scheme and host for base_url, keeping path and query"""
+        if not self.base_url:
+            return url
+        base = urlsplit(self.base_url)
+        parts = urlsplit(url)
+        return urlunsplit((base.scheme, base.netloc, parts.path, parts.query, ""))
+
+    def fetch_html(self, url):
+        """Return the page HTML, or an empty string on any failure"""
+        url = self.rewrite_url(url)
+        if self.rate_limiter:
+            self.rate_limiter.acquire(url)
+
+        try:
+            # requests transparently decompresses gzip responses
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+            return response.text
+        except requests.RequestException as e:
+            metrics.count('http_fetch_failed')
+            return ""
+
+    def fetch_profile(self, profile_url):
+        """Fetch and parse one profile page, None when it could not be fetched"""
+        with metrics.timer('profile_fetch') as timer:
+            html = self.fetch_html(profile_url)
+            if not html:
+                timer.outcome = "error"
+                return None
+            if self.archive:
+                self.archive.add_profile(profile_url, html)
+            profile = parse_profile(html)
+            if not (profile['complete_address'] or profile['patient_stories']):
+                timer.outcome = "empty"
+            return profile
+
+    def fetch_profiles(self, profile_urls):
+        """Fetch several profiles concurrently, returns {profile_url: profile or None}"""
+        profile_urls = list(dict.fromkeys(url for url in profile_urls if url))
+        if not profile_urls:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            profiles = executor.map(self.fetch_profile, profile_urls)
+            return dict(zip(profile_urls, profiles))
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,108 @@
+import re
+import numpy as np
+
+POSITIVE = 0
+NEGATIVE = 1
+
+# Keywords counted once per story in which they appear
+POSITIVE_KEYWORDS = ['good', 'excellent', 'great', 'amazing', 'satisfied', 'recommend', 'best', 'professional', 'caring', 'gentle', 'painless', 'comfortable']
+NEGATIVE_KEYWORDS = ['bad', 'poor', 'terrible', 'painful', 'expensive', 'rude', 'unprofessional', 'disappointed', 'worst', 'avoid']
+
+class Lexicon:
+    """Positive/negative keyword lexicon matched with a single compiled regex"""
+
+    def __init__(self, positive=POSITIVE_KEYWORDS, negative=NEGATIVE_KEYWORDS):
+        self.polarity = {}
+        self.pattern = None
+        self.add(positive, POSITIVE)
+        self.add(negative, NEGATIVE)
+
+    def add(self, keywords, polarity):
+        """Extend the lexicon, the matcher is recompiled once per call"""
+        for keyword in keywords:
+            self.polarity[keyword.lower()] = polarity
+        # Longest first so "unprofessional" is not also counted as "professional"
+        alternation = "|".join(re.escape(keyword) for keyword in sorted(self.polarity, key=len, reverse=True))
+        self.pattern = re.compile(r"\b(?:" + alternation + ")")
+
+    def add_positive(self, keywords):
+        self.add(keywords, POSITIVE)
+
+    def add_negative(self, keywords):
+        self.add(keywords, NEGATIVE)
+
+    def story_polarities(self, story):
+        """Polarity of every distinct keyword found in one story"""
+        return [self.polarity[keyword] for keyword in set(self.pattern.findall(story.lower()))]
+
+DEFAULT_LEXICON = Lexicon()
+
+def score_batch(list_of_story_lists, lexicon=DEFAULT_LEXICON):
+    """Count positive/negative mentions for many doctors at once
+
+    Returns (positive_counts, negative_counts, story_counts) as NumPy arrays, one entry per doctor.
+    """
+    doctor_indices = []
+    polarities = []
+    for doctor_idx, patient_stories in enumerate(list_of_story_lists):
+        for story in patient_stories:
+            for polarity in lexicon.story_polarities(story):
+                doctor_indices.append(doctor_idx)
+                polarities.append(polarity)
+
+    doctor_count = len(list_of_story_lists)
+    doctor_indices = np.asarray(doctor_indices, dtype=np.int64)
+    polarities = np.asarray(polarities, dtype=np.int8)
+
+    positive_counts = np.bincount(doctor_indices[polarities == POSITIVE], minlength=doctor_count)
+    negative_counts = np.bincount(doctor_indices[polarities == NEGATIVE], minlength=doctor_count)
+    story_counts = np.fromiter((len(patient_stories) for patient_stories in list_of_story_lists), dtype=np.int64, count=doctor_count)
+    return positive_counts, negative_counts, story_counts
+
+def ambiguous_mask(positive_counts, negative_counts, margin=0.3, min_mentions=3):
+    """Doctors whose local score is too close to call (or based on too few mentions)"""
+    total = positive_counts + negative_counts
+    balance = np.abs(positive_counts - negative_counts) / np.maximum(total, 1)
+    return (total < min_mentions) | (balance < margin)
+
+def format_summary(positive_count, negative_count, story_count):
+    """2-line summary text based on sentiment counts"""
+    if not story_count:
+        return "No patient stories available for summary."
+
+    if positive_count > negative_count:
+        line1 = f"Positive feedback with {positive_count} positive mentions including professional care and patient satisfaction."
+        line2 = f"Overall recommended based on {story_count} patient reviews."
+    elif negative_count > positive_count:
+        line1 = f"Mixed feedback with {negative_count} concerns mentioned by patients."
+        line2 = f"Consider with caution based on {story_count} patient reviews."
+    else:
+        line1 = f"Balanced feedback with {positive_count} positive and {negative_count} negative mentions."
+        line2 = f"Mixed recommendations from {story_count} patient reviews."
+
+    return f"{line1}\n{line2}"
+
+def summarize_batch(list_of_story_lists, lexicon=DEFAULT_LEXICON):
+    """Local summaries for many doctors at once"""
+    positive_counts, negative_counts, story_counts = score_batch(list_of_story_lists, lexicon)
+    return [
+        format_summary(int(positive), int(negative), int(stories))
+        for positive, negative, stories in zip(positive_counts, negative_counts, story_counts)
+    ]
+
+def summarize_tiered(list_of_story_lists, summarize_ambiguous, margin=0.3, min_mentions=3, lexicon=DEFAULT_LEXICON):
+    """Summarize locally, calling summarize_ambiguous (e.g. Gemini) only for ambiguous doctors
+
+    summarize_ambiguous takes a list of story lists and returns one summary per list.
+    """
+    positive_counts, negative_counts, story_counts = score_batch(list_of_story_lists, lexicon)
+    summaries = [
+        format_summary(int(positive), int(negative), int(stories))
+        for positive, negative, stories in zip(positive_counts, negative_counts, story_counts)
+    ]
+
+    ambiguous = np.flatnonzero(ambiguous_mask(positive_counts, negative_counts, margin, min_mentions) & (story_counts > 0))
+    if len(ambiguous):
+        for doctor_idx, summary in zip(ambiguous, summarize_ambiguous([list_of_story_lists[i] for i in ambiguous])):
+            summaries[doctor_idx] = summary
+    return summaries
@@ -0,0 +1,156 @@
+import json, math, os, threading, time
+
+# Stages timed across the scraper, in pipeline order (used to order the report)
+STAGES = ['search_page_load', 'card_extraction', 'profile_fetch', 'contact_click', 'gemini_call', 'export_stream_row', 'export_excel']
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+class StageTimer:
+    """Context manager timing one stage run; set .outcome to record e.g. 'empty' instead of 'ok'"""
+
+    def __init__(self, metrics, stage):
+        self.metrics = metrics
+        self.stage = stage
+        self.outcome = "ok"
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.outcome = "error"
+        self.metrics.observe(self.stage, time.perf_counter() - self.start, self.outcome)
+        return False
+
+class Metrics:
+    """Per-stage durations and outcome counters, per-field empty rates and free-form counters
+
+    Cheap enough to stay on in every run; the report shows where time goes and the
+    empty rates and error outcomes expose failures that are otherwise swallowed.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.started_at = time.time()
+            self.durations = {}
+            self.outcomes = {}
+            self.counters = {}
+            self.field_records = 0
+            self.field_empty = {}
+
+    def timer(self, stage):
+        return StageTimer(self, stage)
+
+    def observe(self, stage, seconds, outcome="ok"):
+        with self.lock:
+            self.durations.setdefault(stage, []).append(seconds)
+            stage_outcomes = self.outcomes.setdefault(stage, {})
+            stage_outcomes[outcome] = stage_outcomes.get(outcome, 0) + 1
+
+    def count(self, name, amount=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def record_fields(self, records, fields=None):
+        """Count empty (missing or whitespace-only) values per field over finished records"""
+        with self.lock:
+            for record in records:
+                self.field_records += 1
+                for field in (fields or record.keys()):
+                    empty = not str(record.get(field) or '').strip()
+                    self.field_empty[field] = self.field_empty.get(field, 0) + int(empty)
+
+    def report(self):
+        with self.lock:
+            stage_names = [stage for stage in STAGES if stage in self.durations]
+            stage_names += sorted(stage for stage in self.durations if stage not in STAGES)
+            stages = {}
+            for stage in stage_names:
+                values = sorted(self.durations[stage])
+                stages[stage] = {
+                    'count': len(values),
+                    'total_seconds': round(sum(values), 4),
+                    'p50_seconds': round(percentile(values, 0.5), 4),
+                    'p95_seconds': round(percentile(values, 0.95), 4),
+                    'max_seconds': round(values[-1], 4),
+                    'outcomes': dict(self.outcomes.get(stage, {}))
+                }
+
+            fields = {
+                field: {
+                    'empty': empty,
+                    'empty_rate': round(empty / self.field_records, 3) if self.field_records else None
+                }
+                for field, empty in sorted(self.field_empty.items())
+            }
+
+            return {
+                'started_at': self.started_at,
+                'duration_seconds': round(time.time() - self.started_at, 3),
+                'stages': stages,
+                'counters': dict(sorted(self.counters.items())),
+                'records': self.field_records,
+                'fields': fields
+            }
+
+    def write_json(self, path):
+        if not path:
+            return
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+
+    def prometheus_text(self, prefix="doctor_scraper"):
+        """Report in the Prometheus text exposition format"""
+        report = self.report()
+        lines = [
+            f"# HELP {prefix}_run_duration_seconds Wall time of the run so far.",
+            f"# TYPE {prefix}_run_duration_seconds gauge",
+            f"{prefix}_run_duration_seconds {report['duration_seconds']}",
+            f"# HELP {prefix}_stage_duration_seconds Duration of each stage run.",
+            f"# TYPE {prefix}_stage_duration_seconds summary"
+        ]
+        for stage, data in report['stages'].items():
+            lines.append(f'{prefix}_stage_duration_seconds{{stage="{stage}",quantile="0.5"}} {data["p50_seconds"]}')
+            lines.append(f'{prefix}_stage_duration_seconds{{stage="{stage}",quantile="0.95"}} {data["p95_seconds"]}')
+            lines.append(f'{prefix}_stage_duration_seconds_sum{{stage="{stage}"}} {data["total_seconds"]}')
+            lines.append(f'{prefix}_stage_duration_seconds_count{{stage="{stage}"}} {data["count"]}')
+
+        lines.append(f"# HELP {prefix}_stage_outcomes_total Stage runs by outcome (ok, empty, error).")
+        lines.append(f"# TYPE {prefix}_stage_outcomes_total counter")
+        for stage, data in report['stages'].items():
+            for outcome, count in sorted(data['outcomes'].items()):
+                lines.append(f'{prefix}_stage_outcomes_total{{stage="{stage}",outcome="{outcome}"}} {count}')
+
+        lines.append(f"# HELP {prefix}_events_total Free-form event counters.")
+        lines.append(f"# TYPE {prefix}_events_total counter")
+        for name, count in report['counters'].items():
+            lines.append(f'{prefix}_events_total{{event="{name}"}} {count}')
+
+        lines.append(f"# HELP {prefix}_field_empty_ratio Share of scraped records with an empty field.")
+        lines.append(f"# TYPE {prefix}_field_empty_ratio gauge")
+        for field, data in report['fields'].items():
+            if data['empty_rate'] is not None:
+                lines.append(f'{prefix}_field_empty_ratio{{field="{field}"}} {data["empty_rate"]}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """Write a node_exporter textfile; renamed into place so it is never read half-written"""
+        if not path:
+            return
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, path)
+
+# Shared by every module of a run
+metrics = Metrics()
@@ -0,0 +1,162 @@
+"""Browser-free runs over stored data: replay the archive, bulk re-extraction, fill in missing summaries"""
+import os, zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .gemini_service import generate_summary_with_gemini, SummaryPipeline, SummaryCache
+from .local_summarizer import summarize_batch
+from .page_parser import build_doctor_info, parse_card_html, parse_profile
+from .crawl_state import CrawlState
+from .excel_export import COLUMNS_ORDER
+from .selector_registry import registry
+from .metrics import metrics
+
+def extract_archived_card(card, card_html, profile_html=None):
+    """Card + profile HTML to (doctor_info, patient_stories), the offline twin of extract_doctor_details"""
+    doctor_info = build_doctor_info(parse_card_html(card_html))
+    doctor_info['profile_url'] = card['profile_url']
+    doctor_info['contact_number'] = card['meta'].get('contact_number', '')
+    doctor_info['region'] = card['region']
+    doctor_info['search_specialty'] = card['specialty']
+
+    profile = parse_profile(profile_html) if profile_html else {'complete_address': '', 'patient_stories': []}
+    if profile['complete_address']:
+        doctor_info['complete_address'] = profile['complete_address']
+
+    return doctor_info, profile['patient_stories']
+
+def replay_archive(archive, summary_workers=4, summary_cache_path="summary_cache.sqlite"):
+    """Re-run extraction purely from archived HTML, no browser involved"""
+    summary_cache = SummaryCache(summary_cache_path) if summary_cache_path else None
+    summary_pipeline = SummaryPipeline(max_in_flight=summary_workers, cache=summary_cache) if summary_workers > 0 else None
+
+    all_doctors_data = []
+    try:
+        for card in archive.iter_cards():
+            profile_html = archive.latest_profile(card['profile_url']) if card['profile_url'] else None
+            doctor_info, patient_stories = extract_archived_card(card, card['html'], profile_html)
+
+            if patient_stories and summary_pipeline:
+                summary_pipeline.submit(len(all_doctors_data), patient_stories)
+            elif patient_stories:
+                doctor_info['summary_pros_cons'] = generate_summary_with_gemini(patient_stories, cache=summary_cache)
+            else:
+                doctor_info['summary_pros_cons'] = "No patient stories available for summary."
+
+            all_doctors_data.append(doctor_info)
+
+        if summary_pipeline:
+            for position, summary in summary_pipeline.join().items():
+                all_doctors_data[position]['summary_pros_cons'] = summary
+    finally:
+        if summary_pipeline:
+            summary_pipeline.close()
+        if summary_cache:
+            cache_stats = summary_cache.stats()
+            metrics.count('summary_cache_hits', cache_stats['hits'])
+            metrics.count('summary_cache_misses', cache_stats['misses'])
+            summary_cache.close()
+
+    return all_doctors_data
+
+def iter_archive_chunks(archive, chunk_size=200):
+    """Lists of still-compressed archived cards, each with its latest profile attached"""
+    chunk = []
+    for card in archive.iter_cards(decompress=False):
+        card['profile_html'] = archive.latest_profile(card['profile_url'], decompress=False) if card['profile_url'] else None
+        chunk.append(card)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def init_extract_worker(selector_stats_path=None):
+    """Start every worker process with the strategy order learned by earlier runs"""
+    registry.load(selector_stats_path)
+
+def extract_chunk(chunk):
+    """Worker process: decompress and extract one chunk, with local lexicon summaries (no API calls)"""
+    records = []
+    story_lists = []
+    for card in chunk:
+        card_html = zlib.decompress(card['html']).decode("utf-8")
+        profile_html = zlib.decompress(card['profile_html']).decode("utf-8") if card['profile_html'] else None
+        doctor_info, patient_stories = extract_archived_card(card, card_html, profile_html)
+        records.append(doctor_info)
+        story_lists.append(patient_stories)
+
+    with_stories = [idx for idx, patient_stories in enumerate(story_lists) if patient_stories]
+    summaries = summarize_batch([story_lists[idx] for idx in with_stories]) if with_stories else []
+    for doctor_info in records:
+        doctor_info['summary_pros_cons'] = "No patient stories available for summary."
+    for idx, summary in zip(with_stories, summaries):
+        records[idx]['summary_pros_cons'] = summary
+    return records
+
+def bulk_extract(archive, exporter, processes=None, chunk_size=200, selector_stats_path=None):
+    """Re-extract every archived card across a process pool, streaming records to the exporter in crawl order
+
+    The parent only reads compressed rows; decompression, parsing and summaries run in the workers.
+    At most two chunks per process are in flight, so memory stays flat for any corpus size.
+    Returns the number of records extracted.
+    """
+    processes = processes or os.cpu_count() or 1
+    extracted = 0
+    with ProcessPoolExecutor(max_workers=processes, initializer=init_extract_worker,
+                             initargs=(selector_stats_path,)) as executor:
+        in_flight = deque()
+
+        def drain(limit):
+            nonlocal extracted
+            while len(in_flight) > limit:
+                records = in_flight.popleft().result()
+                for doctor_info in records:
+                    exporter.append(doctor_info)
+                metrics.record_fields(records, COLUMNS_ORDER)
+                extracted += len(records)
+
+        for chunk in iter_archive_chunks(archive, chunk_size):
+            in_flight.append(executor.submit(extract_chunk, chunk))
+            drain(2 * processes)
+        drain(0)
+
+    metrics.count('bulk_records_extracted', extracted)
+    return extracted
+
+def summarize_state(state_path="crawl_state.sqlite", archive=None, summary_workers=4,
+                    summary_cache_path="summary_cache.sqlite", summary_batch_size=1, summary_tier_margin=None):
+    """Generate the summaries still missing from stored records (e.g. after an interrupted crawl)
+
+    Patient stories come from the profiles saved in the crawl state, else from the archive.
+    Returns the updated records.
+    """
+    state = CrawlState(state_path)
+    summary_cache = SummaryCache(summary_cache_path) if summary_cache_path else None
+    summary_pipeline = SummaryPipeline(
+        max_in_flight=max(1, summary_workers),
+        cache=summary_cache,
+        batch_size=summary_batch_size,
+        tier_margin=summary_tier_margin
+    )
+
+    try:
+        summaries = {}
+        for doctor_id, profile_url in state.doctors_missing_summary():
+            profile = state.get_profile(profile_url) if profile_url else None
+            if profile is None and archive and profile_url:
+                profile_html = archive.latest_profile(profile_url)
+                profile = parse_profile(profile_html) if profile_html else None
+
+            if profile and profile['patient_stories']:
+                summary_pipeline.submit(doctor_id, profile['patient_stories'])
+            else:
+                summaries[doctor_id] = "No patient stories available for summary."
+
+        summaries.update(summary_pipeline.join())
+        return state.update_summaries(summaries)
+    finally:
+        summary_pipeline.close()
+        if summary_cache:
+            summary_cache.close()
+        state.close()
@@ -0,0 +1,270 @@
+from lxml import html as lxml_html
+import re, json
+
+from .selector_registry import registry
+from .contact_capture import first_phone
+from .records import DoctorRecord
+
+# Search result cards on the Practo listing page
+CARD_XPATH = "//div[contains(concat(' ', normalize-space(@class), ' '), ' u-border-general--bottom ')]"
+
+# Links tried to find the doctor's profile page, as CSS (browser) and XPath (lxml)
+registry.register('profile_link', [
+    ('doctor_name_link', {'css': 'h2[data-qa-id="doctor_name"] a', 'xpath': ".//h2[@data-qa-id='doctor_name']//a"}),
+    ('doctor_path_link', {'css': 'a[href*="/doctor/"]', 'xpath': ".//a[contains(@href, '/doctor/')]"}),
+    ('info_section_link', {'css': '.info-section a', 'xpath': ".//*[contains(concat(' ', normalize-space(@class), ' '), ' info-section ')]//a"})
+], fallbacks=[
+    # Any link mentioning a doctor or the site, only when no profile link was found
+    ('doctor_href_link', {'css': 'a[href*="doctor"]', 'xpath': ".//a[contains(@href, 'doctor')]"}),
+    ('practo_href_link', {'css': 'a[href*="practo.com"]', 'xpath': ".//a[contains(@href, 'practo.com')]"})
+])
+
+# Card texts accepted as a doctor's specialty
+KNOWN_SPECIALTIES = [
+    'cardiologist', 'cardiology', 'heart',
+    'dermatologist', 'dermatology', 'skin',
+    'neurologist', 'neurology', 'brain',
+    'oncologist', 'oncology', 'cancer',
+    'general surgeon', 'surgery',
+    'orthopedic surgeon', 'orthopedics', 'orthopaedic',
+    'neurosurgeon', 'neurosurgery',
+    'pediatrician', 'pediatrics', 'paediatrician', 'paediatrics',
+    'gynecologist', 'gynecology', 'gynaecologist', 'gynaecology', 'obstetrics',
+    'psychiatrist', 'psychiatry', 'mental health',
+    'dentist', 'dental', 'orthodontist', 'endodontist', 'periodontist'
+]
+
+def css_class(name):
+    """XPath predicate matching a single CSS class"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+def element_text(element):
+    """Visible-ish text of an element with whitespace collapsed"""
+    if element is None:
+        return ""
+    return " ".join(element.text_content().split())
+
+def first_text(root, xpath):
+    """Text of the first element matching xpath"""
+    elements = root.xpath(xpath)
+    return element_text(elements[0]) if elements else ""
+
+def all_texts(root, xpath):
+    """Non-empty texts of every element matching xpath"""
+    texts = [element_text(element) for element in root.xpath(xpath)]
+    return [text for text in texts if text]
+
+def absolute_url(href):
+    """Make sure a profile link is a full URL"""
+    if href and href.startswith('/'):
+        return "https://www.practo.com" + href
+    return href or ""
+
+def parse_card_element(card):
+    """Collect the raw texts of a card element (same shape as CARD_EXTRACTION_SCRIPT)"""
+    def profile_link(strategy):
+        links = [link for link in card.xpath(strategy['xpath']) if link.get('href')]
+        return absolute_url(links[0].get('href')) if links else ""
+
+    profile_url = registry.first_match('profile_link', profile_link)
+
+    parent = card.getparent()
+    ld_json = []
+    if parent is not None:
+        ld_json = [script.text or "" for script in parent.xpath(".//script[@type='application/ld+json']")]
+
+    return {
+        'name': first_text(card, ".//*[@data-qa-id='doctor_name']"),
+        'name_candidates': all_texts(card, f".//h2[{css_class('u-jumbo-font')}]"),
+        'span_texts': all_texts(card, ".//span"),
+        'experience_texts': [text for text in all_texts(card, ".//div") if 'years experience' in text.lower()][:1],
+        'clinic': first_text(card, ".//*[@data-qa-id='doctor_clinic_name']"),
+        'clinic_candidates': all_texts(card, f".//span[{css_class('u-c-pointer')}]"),
+        'rating': first_text(card, ".//*[@data-qa-id='doctor_recommendation']"),
+        'rating_candidates': all_texts(card, f".//span[{css_class('o-label--success')}]"),
+        'feedback': first_text(card, ".//*[@data-qa-id='total_feedback']"),
+        'feedback_candidates': all_texts(card, f".//span[{css_class('u-t-underline')}]"),
+        'locality': first_text(card, ".//*[@data-qa-id='practice_locality']"),
+        # Numbers present in the HTML itself (tel: links or an already revealed number)
+        'embedded_phone': first_phone(
+            [link.get('href', '')[4:] for link in card.xpath(".//a[starts-with(@href, 'tel:')]")]
+            + all_texts(card, ".//*[@data-qa-id='phone_number']")
+        ),
+        'ld_json': ld_json,
+        'profile_url': profile_url,
+        'outer_html': lxml_html.tostring(card, encoding="unicode")
+    }
+
+def parse_search_page(page_source):
+    """Collect the raw texts of every card on a search results page"""
+    try:
+        document = lxml_html.document_fromstring(page_source)
+    except Exception as e:
+        return []
+    return [parse_card_element(card) for card in document.xpath(CARD_XPATH)]
+
+def parse_card_html(card_html):
+    """Collect the raw texts of a single saved card (e.g. a data/ backup)"""
+    try:
+        card = lxml_html.fragment_fromstring(card_html, create_parent=False)
+    except Exception as e:
+        return {}
+    return parse_card_element(card)
+
+def parse_address_from_ld_json(ld_json_blocks):
+    """Build an address from JSON-LD structured data"""
+    for block in ld_json_blocks:
+        try:
+            json_data = json.loads(block)
+            if '@type' in json_data and json_data['@type'] == 'Dentist':
+                if 'address' in json_data:
+                    address = json_data['address']
+                    if isinstance(address, dict):
+                        street = address.get('streetAddress', '')
+                        locality = address.get('addressLocality', '')
+                        region = address.get('addressRegion', '')
+                        postal_code = address.get('postalCode', '')
+
+                        address_parts = [street, locality, region, postal_code]
+                        address_parts = [part for part in address_parts if part]
+                        return ', '.join(address_parts)
+        except:
+            continue
+    return ""
+
+def generate_email(doctors_name):
+    """Generate fake email based on doctor's name"""
+    try:
+        if doctors_name and doctors_name != "Unknown":
+            # Clean the name and create email
+            name_parts = doctors_name.lower().split()
+            if len(name_parts) >= 2:
+                # Use first and last name
+                email = f"{name_parts[0]}.{name_parts[-1]}@gmail.com"
+            else:
+                # Use single name
+                email = f"{name_parts[0]}@gmail.com"
+
+            # Remove any special characters and spaces
+            return email.replace(" ", "").replace("-", "").replace("'", "")
+        return "doctor@gmail.com"
+    except:
+        return "doctor@gmail.com"
+
+def first_candidate(candidates, accept):
+    """First candidate text accepted by the predicate"""
+    return next((text for text in candidates if accept(text)), "")
+
+# Fallback chains over the raw card texts, shared by the lxml and in-browser engines.
+# Only the data-qa-id selectors are precise; the class-based heuristics stay pinned behind them
+registry.register('doctors_name', [
+    ('doctor_name', lambda card_data: card_data.get('name', ''))
+], fallbacks=[
+    ('u_jumbo_font', lambda card_data: first_candidate(card_data.get('name_candidates', []), bool))
+])
+registry.register('clinic_hospital', [
+    ('doctor_clinic_name', lambda card_data: card_data.get('clinic', ''))
+], fallbacks=[
+    ('u_c_pointer', lambda card_data: first_candidate(
+        card_data.get('clinic_candidates', []), lambda text: text and not text.isdigit() and len(text) > 3))
+])
+registry.register('ratings', [
+    ('doctor_recommendation', lambda card_data: card_data.get('rating', ''))
+], fallbacks=[
+    ('o_label_success', lambda card_data: first_candidate(card_data.get('rating_candidates', []), lambda text: '%' in text))
+])
+registry.register('reviews', [
+    ('total_feedback', lambda card_data: card_data.get('feedback', ''))
+], fallbacks=[
+    ('u_t_underline', lambda card_data: first_candidate(
+        card_data.get('feedback_candidates', []), lambda text: 'patient' in text.lower() or 'stories' in text.lower()))
+])
+
+def build_doctor_info(card_data):
+    """Turn the raw card texts into a DoctorRecord"""
+    doctor_info = DoctorRecord()
+
+    try:
+        # Extract doctor name
+        doctor_info['doctors_name'] = registry.first_match('doctors_name', lambda strategy: strategy(card_data), "Unknown")
+
+        # Extract specialty
+        for text in card_data.get('span_texts', []):
+            if text.lower() in KNOWN_SPECIALTIES:
+                doctor_info['specialty'] = text
+                break
+
+        # Extract years of experience
+        for text in card_data.get('experience_texts', []):
+            # Extract just the number
+            match = re.search(r'(\d+)\s*years experience', text.lower())
+            if match:
+                doctor_info['years_of_experience'] = f"{match.group(1)} years"
+            else:
+                doctor_info['years_of_experience'] = text
+            break
+
+        # Extract clinic/hospital name
+        doctor_info['clinic_hospital'] = registry.first_match('clinic_hospital', lambda strategy: strategy(card_data))
+
+        # Fallback address from JSON-LD structured data, the profile address wins when available
+        doctor_info['complete_address'] = parse_address_from_ld_json(card_data.get('ld_json', []))
+
+        # Extract ratings
+        doctor_info['ratings'] = registry.first_match('ratings', lambda strategy: strategy(card_data))
+
+        # Extract reviews/patient stories
+        doctor_info['reviews'] = registry.first_match('reviews', lambda strategy: strategy(card_data))
+
+        # Extract location
+        location = card_data.get('locality', '')
+        if location and not doctor_info['complete_address']:
+            doctor_info['complete_address'] = location
+
+        # Generate fake email based on doctor's name
+        doctor_info['contact_email'] = generate_email(doctor_info['doctors_name'])
+
+    except Exception as e:
+        pass
+
+    return doctor_info
+
+def parse_card(card_html):
+    """Parse a saved card's HTML into a doctor_info dict"""
+    return build_doctor_info(parse_card_html(card_html))
+
+def parse_profile(page_source):
+    """Parse a profile page into its address and patient stories"""
+    profile = {
+        'complete_address': '',
+        'patient_stories': []
+    }
+
+    try:
+        document = lxml_html.document_fromstring(page_source)
+    except Exception as e:
+        return profile
+
+    profile['complete_address'] = first_text(document, "//*[@data-qa-id='clinic-address']")
+
+    profile['patient_stories'] = registry.first_match('patient_stories', lambda strategy: strategy(document), [])
+    return profile
+
+def generic_stories(document):
+    """Any text that might be reviews: elements mentioning patient/treatment/doctor"""
+    patient_stories = []
+    for element in document.xpath("//body//*[self::p or self::div or self::span]")[:50]:
+        text = element_text(element)
+        if text and len(text) > 20 and ('patient' in text.lower() or 'treatment' in text.lower() or 'doctor' in text.lower()):
+            if len(patient_stories) < 10:
+                patient_stories.append(text)
+    return patient_stories
+
+# Where patient stories are looked for on the profile page
+registry.register('patient_stories', [
+    ('review_text', lambda document: [text for text in all_texts(document, "//*[@data-qa-id='review-text']")[:10] if len(text) > 10]),
+    ('feedback_content', lambda document: [text for text in all_texts(document, f"//*[{css_class('feedback_content')}]")[:10] if len(text) > 10])
+], fallbacks=[
+    # Page text that merely mentions patients or doctors, only when no review element exists
+    ('generic_text', generic_stories)
+])
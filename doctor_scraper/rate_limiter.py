@@ -0,0 +1,58 @@
+import random, threading, time
+from urllib.parse import urlparse
+
+class TokenBucket:
+    """Token bucket refilled at `rate` tokens per second, holding at most `capacity` tokens"""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token and return how long the caller must wait before using it"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+            # Going negative queues the caller behind earlier reservations
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+class RateLimiter:
+    """Per-host request rate limiter with random jitter"""
+
+    def __init__(self, rate=0.5, burst=1, jitter=0.5):
+        self.configure(rate, burst, jitter)
+
+    def configure(self, rate=0.5, burst=1, jitter=0.5):
+        """Set the allowed requests per second per host, the burst size and the max jitter in seconds"""
+        self.rate = rate
+        self.burst = burst
+        self.jitter = jitter
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def bucket_for(self, url):
+        host = urlparse(url).netloc or url
+        with self.lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(self.rate, self.burst)
+            return self.buckets[host]
+
+    def acquire(self, url):
+        """Block until a request to url's host is allowed"""
+        if not self.rate or self.rate <= 0:
+            return
+
+        delay = self.bucket_for(url).reserve()
+        if delay > 0:
+            # Jitter only spreads out requests that were held back, free tokens go straight through
+            if self.jitter:
+                delay += random.uniform(0, self.jitter)
+            time.sleep(delay)
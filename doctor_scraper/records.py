@@ -0,0 +1,113 @@
+"""Doctor records: a slotted row type and a columnar accumulator for exports"""
+
+# Every field of a doctor record, in export column order
+FIELDS = (
+    'complete_address',
+    'doctors_name',
+    'specialty',
+    'region',
+    'search_specialty',
+    'clinic_hospital',
+    'years_of_experience',
+    'contact_number',
+    'contact_email',
+    'ratings',
+    'reviews',
+    'summary_pros_cons',
+    'profile_url'
+)
+
+class DoctorRecord:
+    """One doctor, stored in slots instead of a per-record dict
+
+    Supports the dict-style access (`record['field']`, `get`, `keys`) the rest of the code
+    uses, so `dict(record)` and `json.dumps(dict(record))` work as for a plain dict.
+    """
+    __slots__ = FIELDS
+
+    def __init__(self, **values):
+        for field in FIELDS:
+            setattr(self, field, values.pop(field, ''))
+        if values:
+            raise TypeError(f"Unknown doctor record fields: {', '.join(values)}")
+
+    @classmethod
+    def from_dict(cls, data):
+        """Record from a stored dict, fields unknown to this version are dropped"""
+        return cls(**{field: data[field] for field in FIELDS if field in data})
+
+    def __getitem__(self, field):
+        if field not in FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __setitem__(self, field, value):
+        if field not in FIELDS:
+            raise KeyError(field)
+        setattr(self, field, value)
+
+    def __contains__(self, field):
+        return field in FIELDS
+
+    def get(self, field, default=None):
+        return getattr(self, field) if field in FIELDS else default
+
+    def keys(self):
+        return FIELDS
+
+    def items(self):
+        return [(field, getattr(self, field)) for field in FIELDS]
+
+    def __eq__(self, other):
+        if isinstance(other, (DoctorRecord, dict)):
+            return self.items() == [(field, other.get(field, '')) for field in FIELDS]
+        return NotImplemented
+
+    def __repr__(self):
+        return f"DoctorRecord({self.doctors_name!r}, {self.profile_url!r})"
+
+class ColumnStore:
+    """Accumulate records straight into one list per field
+
+    pandas and pyarrow take the columns as they are, without a row-by-row conversion.
+    Values are kept as text, missing ones as ''.
+    """
+
+    def __init__(self, fields=FIELDS):
+        self.fields = list(fields)
+        self.columns = {field: [] for field in self.fields}
+        self.size = 0
+
+    @classmethod
+    def from_records(cls, records, fields=FIELDS):
+        store = cls(fields)
+        store.extend(records)
+        return store
+
+    def append(self, record):
+        for field in self.fields:
+            value = record.get(field)
+            self.columns[field].append('' if value is None else str(value))
+        self.size += 1
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def clear(self):
+        for column in self.columns.values():
+            column.clear()
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def to_pandas(self):
+        import pandas as pd
+
+        return pd.DataFrame(self.columns, columns=self.fields)
+
+    def to_arrow(self, schema=None):
+        import pyarrow as pa
+
+        return pa.Table.from_pydict(self.columns, schema=schema)
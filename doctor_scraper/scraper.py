@@ -0,0 +1,718 @@
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.action_chains import ActionChains
+import json, threading, queue
+
+# Import from our modules
+from .gemini_service import generate_summary_with_gemini, SummaryPipeline, SummaryCache
+from .page_parser import build_doctor_info, parse_search_page, parse_profile, absolute_url
+from .doctor_index import DoctorIndex, doctor_key
+from .fingerprints import ChangeTracker, card_fingerprint, profile_fingerprint
+from .selector_registry import registry
+from .metrics import metrics
+from .contact_capture import enable_network_capture, drain_performance_log, capture_contact_number, first_phone
+from .rate_limiter import RateLimiter
+from .crawl_state import CrawlState
+from .http_fetcher import ProfileFetcher
+from .browser_session import BrowserSession
+
+# Define specialties to scrape
+SPECIALTIES = [
+    "Cardiologist",
+    "Dermatologist", 
+    "Neurologist",
+    "Oncologist",
+    "General Surgeon",
+    "Orthopedic Surgeon",
+    "Neurosurgeon",
+    "Pediatrician",
+    "Gynecologist",
+    "Psychiatrist"
+]
+
+# Define regions to search in Pune
+REGIONS = ["Aundh", "Baner", "Wakad"]
+
+# Base URL for Practo search
+BASE_URL = "https://www.practo.com/search/doctors?results_type=doctor&q=%5B%7B%22word%22%3A%22{specialty}%22%2C%22autocompleted%22%3Atrue%2C%22category%22%3A%22subspeciality%22%7D%2C%7B%22word%22%3A%22{region}%22%2C%22autocompleted%22%3Atrue%2C%22category%22%3A%22locality%22%7D%5D&city=Pune&page={page}"
+
+def create_driver(headless=False, capture_network=False, profile=None):
+    """Create a Chrome WebDriver session, optionally with a browser profile's launch settings"""
+    options = webdriver.ChromeOptions()
+    if profile:
+        profile.chrome_options(options)
+    if headless and not (profile and profile.headless):
+        options.add_argument("--headless=new")
+    if capture_network:
+        # Network events land in the performance log so XHR responses can be read back
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    driver = webdriver.Chrome(options=options)
+    if profile:
+        profile.apply(driver)
+    if capture_network:
+        enable_network_capture(driver)
+    return driver
+
+def regular_click(driver, contact_button):
+    contact_button.click()
+    return True
+
+def javascript_click(driver, contact_button):
+    driver.execute_script("arguments[0].click();", contact_button)
+    return True
+
+def action_chains_click(driver, contact_button):
+    ActionChains(driver).move_to_element(contact_button).click().perform()
+    return True
+
+registry.register('contact_click', [
+    ('regular_click', regular_click),
+    ('javascript_click', javascript_click),
+    ('action_chains_click', action_chains_click)
+])
+
+def read_phone_element(phone_element):
+    """Phone number text of an element if it looks valid"""
+    phone_number = phone_element.text.strip()
+    
+    # Additional verification - check if this is a valid phone number
+    if phone_number and len(phone_number) >= 10:
+        return phone_number
+    return ""
+
+def wait_for_phone_element(driver, doctor_card, timeout=10):
+    """Wait for the revealed phone number, preferring the one inside this card"""
+    phone_selector = '[data-qa-id="phone_number"]'
+    
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda _: doctor_card.find_elements(By.CSS_SELECTOR, phone_selector)
+            or driver.find_elements(By.CSS_SELECTOR, phone_selector)
+        )
+    except TimeoutException:
+        return ""
+    
+    # A number rendered inside the card cannot belong to another doctor
+    card_phone_elements = doctor_card.find_elements(By.CSS_SELECTOR, phone_selector)
+    if card_phone_elements:
+        return read_phone_element(card_phone_elements[-1])
+    
+    # Otherwise the last (most recent) phone number element on the page
+    all_phone_elements = driver.find_elements(By.CSS_SELECTOR, phone_selector)
+    return read_phone_element(all_phone_elements[-1]) if all_phone_elements else ""
+
+def extract_contact_info(driver, doctor_card, card_data=None, contact_mode="click"):
+    """Timed wrapper around read_contact_info"""
+    with metrics.timer('contact_click') as timer:
+        phone_number = read_contact_info(driver, doctor_card, card_data, contact_mode)
+        if phone_number is None:
+            timer.outcome = "error"
+        elif not phone_number:
+            timer.outcome = "empty"
+    return phone_number or ""
+
+def read_contact_info(driver, doctor_card, card_data=None, contact_mode="click"):
+    """Extract contact information for a card
+    
+    In "network" mode the number is taken from data embedded in the card, else from the
+    contact XHR response captured through the DevTools network log; the on-page number
+    after a click is only the last resort. "click" mode clicks and reads the page.
+    Returns None when reading failed with an error.
+    """
+    try:
+        # Numbers already embedded in the card HTML need no click at all
+        if contact_mode == "network" and card_data and card_data.get('embedded_phone'):
+            return card_data['embedded_phone']
+        
+        # First, check if the contact button exists
+        contact_buttons = doctor_card.find_elements(By.CSS_SELECTOR, '[data-qa-id="call_button"]')
+        
+        if not contact_buttons:
+            return ""
+        
+        contact_button = contact_buttons[0]
+        
+        if contact_mode == "network":
+            # Forget earlier traffic so only this card's contact request is considered
+            drain_performance_log(driver)
+            registry.first_match('contact_click', lambda strategy: strategy(driver, contact_button), False)
+            phone_number = capture_contact_number(driver)
+            if phone_number:
+                return phone_number
+            return wait_for_phone_element(driver, doctor_card, timeout=2)
+        
+        # Scroll to the button to ensure it's visible, then wait only until it is clickable
+        driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});", contact_button)
+        try:
+            WebDriverWait(driver, 5).until(EC.element_to_be_clickable(contact_button))
+        except TimeoutException:
+            pass
+        
+        # Try the click strategies, the one that currently works goes first
+        click_successful = registry.first_match('contact_click', lambda strategy: strategy(driver, contact_button), False)
+        
+        if not click_successful:
+            return ""
+        
+        # Wait for the contact info to appear
+        return wait_for_phone_element(driver, doctor_card)
+        
+    except Exception as e:
+        return None
+
+# Politeness is expressed as a request rate per host, shared by all workers
+rate_limiter = RateLimiter()
+
+# Append-only store of every card and profile page seen, opened by main()
+html_archive = None
+
+# Per-run cache of parsed profile pages keyed by profile URL
+profile_cache = {}
+profile_cache_lock = threading.Lock()
+
+def find_profile_url(doctor_card):
+    """Find the doctor's profile URL in the card"""
+    def profile_link(strategy):
+        links = doctor_card.find_elements(By.CSS_SELECTOR, strategy['css'])
+        return absolute_url(links[0].get_attribute('href')) if links else ""
+    
+    return registry.first_match('profile_link', profile_link)
+
+def fetch_profile(driver, profile_url):
+    """Timed wrapper around load_profile_tab (None on failure)"""
+    with metrics.timer('profile_fetch') as timer:
+        profile = load_profile_tab(driver, profile_url)
+        if profile is None:
+            timer.outcome = "error"
+        elif not (profile['complete_address'] or profile['patient_stories']):
+            timer.outcome = "empty"
+    return profile
+
+def load_profile_tab(driver, profile_url):
+    """Open the profile page once and extract every profile field in the same pass (None on failure)"""
+    profile = None
+    
+    session = driver if isinstance(driver, BrowserSession) else None
+    search_window = driver.current_window_handle
+    profile_window = None
+    
+    try:
+        rate_limiter.acquire(profile_url)
+        if session:
+            # Reuse the session's persistent profile tab
+            session.open_profile(profile_url)
+        else:
+            # Open profile in new tab
+            known_windows = set(driver.window_handles)
+            driver.execute_script("window.open(arguments[0], '_blank');", profile_url)
+            
+            # Switch to the new tab
+            profile_window = next(handle for handle in driver.window_handles if handle not in known_windows)
+            driver.switch_to.window(profile_window)
+        
+        # Wait for page to load
+        wait = WebDriverWait(driver, 15)
+        
+        try:
+            # Wait for the address element to appear
+            wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, '[data-qa-id="clinic-address"]'))
+            )
+        except TimeoutException:
+            pass
+        
+        # Grab the rendered page once and parse every field offline
+        page_source = driver.page_source
+        profile = parse_profile(page_source)
+        if html_archive:
+            html_archive.add_profile(profile_url, page_source)
+    
+    except Exception as e:
+        pass
+    
+    finally:
+        # Only ever close the tab opened here, then make sure we're back on the search page
+        try:
+            if profile_window:
+                driver.switch_to.window(profile_window)
+                driver.close()
+        except Exception as e:
+            pass
+        driver.switch_to.window(search_window)
+    
+    return profile
+
+def get_profile(driver, profile_url, state=None, fetcher=None):
+    """Return the parsed profile for a URL, fetching it at most once per run (or per crawl state)"""
+    if not profile_url:
+        return {'complete_address': '', 'patient_stories': []}
+    
+    with profile_cache_lock:
+        if profile_url in profile_cache:
+            return profile_cache[profile_url]
+    
+    # Profiles fetched by an earlier, interrupted run are reused
+    profile = state.get_profile(profile_url) if state else None
+    if profile is None:
+        if fetcher:
+            profile = fetcher.fetch_profile(profile_url)
+        else:
+            profile = fetch_profile(driver, profile_url)
+        # Failed loads are neither cached nor stored, so a later listing or --resume retries them
+        if profile is None:
+            return {'complete_address': '', 'patient_stories': []}
+        if state:
+            state.save_profile(profile_url, profile)
+    
+    with profile_cache_lock:
+        profile_cache[profile_url] = profile
+    
+    return profile
+
+def prefetch_profiles(profile_urls, state=None, fetcher=None):
+    """Fetch all not yet known profiles concurrently over HTTP and cache them"""
+    with profile_cache_lock:
+        missing = [url for url in profile_urls if url and url not in profile_cache]
+    
+    cached = {}
+    if state:
+        for url in missing:
+            profile = state.get_profile(url)
+            if profile is not None:
+                cached[url] = profile
+    
+    fetched = fetcher.fetch_profiles([url for url in missing if url not in cached])
+    # Failures are left out, get_profile retries them
+    fetched = {url: profile for url, profile in fetched.items() if profile is not None}
+    if state:
+        for url, profile in fetched.items():
+            state.save_profile(url, profile)
+    
+    with profile_cache_lock:
+        profile_cache.update(cached)
+        profile_cache.update(fetched)
+
+def extract_detailed_address(driver, doctor_card):
+    """Extract detailed address from the doctor's profile page"""
+    return get_profile(driver, find_profile_url(doctor_card))['complete_address']
+
+def extract_patient_stories(driver, doctor_card):
+    """Extract patient stories/reviews from the doctor's profile page"""
+    return get_profile(driver, find_profile_url(doctor_card))['patient_stories']
+
+
+# Serializes every card passed in arguments[0] in a single WebDriver round-trip.
+# Only raw texts are collected here, the field fallback logic runs in Python.
+CARD_EXTRACTION_SCRIPT = """
+const cards = arguments[0];
+const profileLinkStrategies = arguments[1];
+const text = (el) => el ? (el.innerText || '').trim() : '';
+const first = (card, selector) => text(card.querySelector(selector));
+const all = (card, selector) => Array.from(card.querySelectorAll(selector)).map(text).filter(t => t);
+const profileLink = (card) => {
+    for (const [name, selector] of profileLinkStrategies) {
+        const link = card.querySelector(selector);
+        if (link && link.href) {
+            return [link.href, name];
+        }
+    }
+    return ['', ''];
+};
+return JSON.stringify(cards.map((card) => {
+    const [profileUrl, profileLinkStrategy] = profileLink(card);
+    return {
+        name: first(card, '[data-qa-id="doctor_name"]'),
+        name_candidates: all(card, 'h2.u-jumbo-font'),
+        span_texts: all(card, 'span'),
+        experience_texts: all(card, 'div').filter(t => t.toLowerCase().includes('years experience')).slice(0, 1),
+        clinic: first(card, '[data-qa-id="doctor_clinic_name"]'),
+        clinic_candidates: all(card, 'span.u-c-pointer'),
+        rating: first(card, '[data-qa-id="doctor_recommendation"]'),
+        rating_candidates: all(card, 'span.o-label--success'),
+        feedback: first(card, '[data-qa-id="total_feedback"]'),
+        feedback_candidates: all(card, 'span.u-t-underline'),
+        locality: first(card, '[data-qa-id="practice_locality"]'),
+        embedded_phone: Array.from(card.querySelectorAll('a[href^="tel:"]')).map(a => a.getAttribute('href').slice(4))
+            .concat(all(card, '[data-qa-id="phone_number"]')),
+        ld_json: card.parentElement
+            ? Array.from(card.parentElement.querySelectorAll("script[type='application/ld+json']")).map(s => s.innerHTML)
+            : [],
+        profile_url: profileUrl,
+        profile_link_strategy: profileLinkStrategy,
+        outer_html: card.outerHTML
+    };
+}));
+"""
+
+def extract_cards_data(driver, doctor_cards):
+    """Serialize the raw texts of all cards with one execute_script call"""
+    if not doctor_cards:
+        return []
+    
+    # The browser tries the profile link selectors in the registry's current order
+    strategy_names = [name for name, _ in registry.ordered('profile_link')]
+    strategies = [[name, strategy['css']] for name, strategy in registry.ordered('profile_link')]
+    
+    try:
+        cards_data = json.loads(driver.execute_script(CARD_EXTRACTION_SCRIPT, list(doctor_cards), strategies))
+    except Exception as e:
+        return [{} for _ in doctor_cards]
+    
+    for card_data in cards_data:
+        registry.record_chain('profile_link', strategy_names, card_data.get('profile_link_strategy'))
+        card_data['embedded_phone'] = first_phone(card_data.get('embedded_phone', []))
+    return cards_data
+
+def extract_doctor_details(driver, doctor_card, card_data=None, state=None, fetcher=None):
+    """Extract all doctor details from the card"""
+    if card_data is None:
+        card_data = extract_cards_data(driver, [doctor_card])[0]
+    
+    doctor_info = build_doctor_info(card_data)
+    doctor_info['profile_url'] = card_data.get('profile_url', '')
+    
+    # Extract detailed address from profile page
+    profile = get_profile(driver, doctor_info['profile_url'], state, fetcher)
+    if profile['complete_address']:
+        doctor_info['complete_address'] = profile['complete_address']
+    
+    return doctor_info
+
+
+def iter_search_pages(driver, specialty, region, limit=5, max_pages=10, engine="html"):
+    """Lazily walk result pages, yielding [(position, element, card_data), ...] per page
+    
+    Stops once `limit` cards have been yielded, after `max_pages` pages, or on an empty page.
+    The next page is only loaded when the caller asks for it.
+    """
+    position = 0
+    for page in range(1, max_pages + 1):
+        if position >= limit:
+            return
+        
+        # Navigate to the specialty-region page
+        search_url = BASE_URL.format(
+            specialty=specialty.replace(" ", "%20"),
+            region=region.replace(" ", "%20"),
+            page=page
+        )
+        rate_limiter.acquire(search_url)
+        with metrics.timer('search_page_load') as timer:
+            driver.get(search_url)
+            
+            # Wait for doctor cards to load, no cards means we ran past the last page
+            try:
+                elems = WebDriverWait(driver, 20).until(
+                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.u-border-general--bottom"))
+                )
+            except TimeoutException:
+                elems = []
+                timer.outcome = "empty"
+        
+        elems = elems[:limit - position]
+        if not elems:
+            return
+        
+        # Serialize all cards we need in a single pass
+        with metrics.timer('card_extraction') as timer:
+            if engine == "js":
+                cards_data = extract_cards_data(driver, elems)
+            else:
+                # Cards come back in document order, matching the located elements
+                cards_data = parse_search_page(driver.page_source)
+                if len(cards_data) < len(elems):
+                    metrics.count('html_engine_fallback')
+                    cards_data = extract_cards_data(driver, elems)
+            if not any(cards_data):
+                timer.outcome = "empty"
+        
+        page_cards = [(position + idx, elem, card_data) for idx, (elem, card_data) in enumerate(zip(elems, cards_data))]
+        position += len(page_cards)
+        yield page_cards
+
+def iter_search_results(driver, specialty, region, limit=5, max_pages=10, engine="html"):
+    """Lazily yield (position, element, card_data) for the top `limit` doctors of a search"""
+    for page_cards in iter_search_pages(driver, specialty, region, limit, max_pages, engine):
+        yield from page_cards
+
+def scrape_combination(driver, specialty, region, engine="html", state=None, fetcher=None, summary_pipeline=None,
+                       summary_cache=None, doctor_index=None, max_results=5, max_pages=10, contact_mode="click",
+                       change_tracker=None):
+    """Scrape the top doctors listed for one specialty-region combination"""
+    doctors_data = []
+    claimed_keys = []
+    submitted_ids = []
+    
+    try:
+        for page_cards in iter_search_pages(driver, specialty, region, max_results, max_pages, engine):
+            scrape_page(driver, specialty, region, page_cards, doctors_data, claimed_keys, state, fetcher,
+                        summary_pipeline, summary_cache, doctor_index, contact_mode, change_tracker, submitted_ids)
+    except Exception as e:
+        # Let a retry of this task (or another listing) scrape these doctors
+        if doctor_index:
+            for key in claimed_keys:
+                doctor_index.release(key)
+        # Summaries of this attempt must not land on whatever record a retry puts at their position
+        if summary_pipeline and submitted_ids:
+            summary_pipeline.discard(submitted_ids)
+        raise
+    
+    return doctors_data
+
+def scrape_page(driver, specialty, region, page_cards, doctors_data, claimed_keys, state=None, fetcher=None,
+                summary_pipeline=None, summary_cache=None, doctor_index=None, contact_mode="click", change_tracker=None,
+                submitted_ids=None):
+    """Scrape the cards of the currently loaded results page into doctors_data
+    
+    Ids of background summary requests are appended to submitted_ids when given.
+    """
+    # Skip doctors already scraped under another region/specialty before any expensive work
+    cards_to_scrape = []
+    for idx, elem, card_data in page_cards:
+        key = doctor_key(card_data.get('profile_url', ''))
+        if not key:
+            card_info = build_doctor_info(card_data)
+            key = doctor_key('', card_info['doctors_name'], card_info['clinic_hospital'])
+        if doctor_index and not doctor_index.claim(key):
+            metrics.count('duplicate_listing')
+            if state:
+                state.add_listing(key, region, specialty)
+            continue
+        claimed_keys.append(key)
+        
+        # In incremental runs, compare the card with the doctor's snapshot from the last run
+        card_fp, snapshot = None, None
+        if change_tracker and state:
+            card_fp = card_fingerprint(card_data)
+            snapshot = state.get_snapshot(key)
+        cards_to_scrape.append((idx, elem, card_data, key, card_fp, snapshot))
+    
+    # Over HTTP, all profiles of this page are fetched concurrently up front
+    if fetcher:
+        prefetch_profiles([card_data.get('profile_url', '') for _, _, card_data, _, card_fp, snapshot in cards_to_scrape
+                           if not (snapshot and snapshot['card_fingerprint'] == card_fp)], state, fetcher)
+    
+    for idx, elem, card_data, key, card_fp, snapshot in cards_to_scrape:
+        
+        if snapshot and snapshot['card_fingerprint'] == card_fp:
+            # Unchanged card: reuse the previous record, no profile fetch, click or summary
+            doctor_info = snapshot['doctor_info']
+            phone_number = doctor_info.get('contact_number', '')
+            change_tracker.record(key, "unchanged", card_fp, snapshot['profile_fingerprint'], doctor_info.get('doctors_name', ''))
+        else:
+            # Extract all doctor details (including detailed address)
+            doctor_info = extract_doctor_details(driver, elem, card_data, state, fetcher)
+            
+            # Extract contact information (needs the live page for the click)
+            phone_number = extract_contact_info(driver, elem, card_data, contact_mode)
+            doctor_info['contact_number'] = phone_number
+            
+            # Extract patient stories and generate summary
+            profile = get_profile(driver, doctor_info['profile_url'], state, fetcher)
+            patient_stories = profile['patient_stories']
+            profile_fp = profile_fingerprint(profile) if change_tracker else None
+            
+            if snapshot and snapshot['profile_fingerprint'] == profile_fp and snapshot['doctor_info'].get('summary_pros_cons'):
+                # Only the card changed, the stories behind the last summary are the same
+                doctor_info['summary_pros_cons'] = snapshot['doctor_info']['summary_pros_cons']
+            elif patient_stories and summary_pipeline:
+                # Summarized in the background, joined back into the record (by its stored position) before export
+                doctor_id = (region, specialty, len(doctors_data))
+                summary_pipeline.submit(doctor_id, patient_stories)
+                if submitted_ids is not None:
+                    submitted_ids.append(doctor_id)
+            elif patient_stories:
+                summary = generate_summary_with_gemini(patient_stories, cache=summary_cache)
+                doctor_info['summary_pros_cons'] = summary
+            else:
+                doctor_info['summary_pros_cons'] = "No patient stories available for summary."
+            
+            if change_tracker:
+                change_tracker.record(key, "changed" if snapshot else "new", card_fp, profile_fp, doctor_info['doctors_name'])
+        
+        # Add region information to doctor data
+        doctor_info['region'] = region
+        doctor_info['search_specialty'] = specialty
+        
+        # Add to our data collection
+        doctors_data.append(doctor_info)
+        
+        # Archive the card HTML for offline replay, with the contact number only the click reveals
+        if html_archive:
+            d = card_data.get('outer_html') or elem.get_attribute("outerHTML")
+            html_archive.add_card(region, specialty, idx, d, doctor_info['profile_url'],
+                                  meta={'contact_number': phone_number})
+
+def restart_browser(session):
+    """Replace a crashed browser, False if starting a new one failed too"""
+    try:
+        session.restart()
+        return True
+    except Exception as e:
+        metrics.count('driver_restart_failed')
+        return False
+
+def crawl_worker(task_queue, state, headless, engine, fetcher=None, summary_pipeline=None, summary_cache=None,
+                 exporter=None, doctor_index=None, max_results=5, max_pages=10, contact_mode="click",
+                 browser_profile=None, change_tracker=None, recycle_pages=200, recycle_rss_mb=None):
+    """Pull (region, specialty) tasks off the shared queue with a dedicated, periodically restarted driver"""
+    driver = BrowserSession(
+        lambda: create_driver(headless=headless, capture_network=contact_mode == "network", profile=browser_profile),
+        prepare_tab=browser_profile.apply if browser_profile else None,
+        max_pages=recycle_pages,
+        max_rss_mb=recycle_rss_mb
+    )
+    try:
+        while True:
+            try:
+                region, specialty = task_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            # A task that died with its browser is retried once in a fresh one. Other failures are
+            # recorded and left unfinished so --resume retries them
+            error = None
+            for attempt in range(2):
+                try:
+                    doctors_data = scrape_combination(driver, specialty, region, engine, state, fetcher, summary_pipeline,
+                                                      summary_cache, doctor_index, max_results, max_pages, contact_mode,
+                                                      change_tracker)
+                    error = None
+                    break
+                except Exception as e:
+                    error = e
+                    if driver.is_alive():
+                        break
+                    # The remaining tasks need a working browser either way
+                    if not restart_browser(driver) or attempt:
+                        break
+                    metrics.count('task_retried')
+            
+            if error:
+                metrics.count('task_failed')
+                state.fail_task(region, specialty, error)
+                continue
+            
+            state.complete_task(region, specialty, doctors_data)
+            
+            # Records still waiting for a background summary are streamed once it is joined
+            if exporter:
+                for doctor_info in doctors_data:
+                    if doctor_info['summary_pros_cons']:
+                        exporter.append(doctor_info)
+    finally:
+        driver.quit()
+
+def run_crawl(workers=1, headless=False, engine="html", state_path="crawl_state.sqlite", resume=False,
+              profile_fetch="browser", http_concurrency=4, profile_base_url=None, summary_workers=4,
+              summary_cache_path="summary_cache.sqlite", summary_batch_size=1, summary_tier_margin=None,
+              exporter=None, max_results=5, max_pages=10, contact_mode="click", browser_profile=None,
+              incremental=False, change_report_path="change_report.json", recycle_pages=200, recycle_rss_mb=None):
+    """Crawl every region-specialty combination using a pool of WebDriver workers
+    
+    With incremental, doctors whose card fingerprint matches their snapshot from an earlier
+    run are reused as they were, and a new/changed/removed report is written.
+    Each worker's Chrome is restarted every `recycle_pages` page loads or once its
+    processes use more than `recycle_rss_mb` MB.
+    """
+    state = CrawlState(state_path)
+    
+    # One pooled HTTP client is shared by all workers
+    fetcher = None
+    if profile_fetch == "http":
+        fetcher = ProfileFetcher(
+            concurrency=http_concurrency,
+            base_url=profile_base_url,
+            rate_limiter=rate_limiter,
+            archive=html_archive
+        )
+    
+    # Unchanged patient stories are summarized once across runs
+    summary_cache = SummaryCache(summary_cache_path) if summary_cache_path else None
+    
+    # Summaries are generated concurrently with scraping, 0 keeps them inline
+    summary_pipeline = None
+    if summary_workers > 0:
+        summary_pipeline = SummaryPipeline(
+            max_in_flight=summary_workers,
+            cache=summary_cache,
+            batch_size=summary_batch_size,
+            tier_margin=summary_tier_margin
+        )
+    if not resume:
+        state.reset()
+    
+    tasks = [(region, specialty) for region in REGIONS for specialty in SPECIALTIES]
+    
+    # Skip combinations already finished by an earlier run
+    task_queue = queue.Queue()
+    pending = [task for task in tasks if not state.is_task_done(*task)]
+    for task in pending:
+        task_queue.put(task)
+    
+    # Doctors stored by an earlier run count as already scraped
+    doctor_index = DoctorIndex(state.doctor_keys())
+    
+    # Records finished by an earlier run go to the streaming outputs first
+    if exporter:
+        for doctor_info in state.load_doctors(tasks):
+            if doctor_info['summary_pros_cons']:
+                exporter.append(doctor_info)
+    
+    # Profiles are cached for the duration of a single run only
+    with profile_cache_lock:
+        profile_cache.clear()
+    
+    change_tracker = ChangeTracker() if incremental else None
+    
+    try:
+        # Each worker owns its own Chrome session, never share a driver across threads
+        threads = []
+        for _ in range(min(max(1, workers), len(pending))):
+            thread = threading.Thread(
+                target=crawl_worker,
+                args=(task_queue, state, headless, engine, fetcher, summary_pipeline, summary_cache, exporter, doctor_index,
+                      max_results, max_pages, contact_mode, browser_profile, change_tracker, recycle_pages, recycle_rss_mb)
+            )
+            thread.start()
+            threads.append(thread)
+        
+        for thread in threads:
+            thread.join()
+        
+        if summary_pipeline:
+            # Records of an interrupted earlier run may still lack their summary
+            submitted = summary_pipeline.join()
+            for doctor_id, profile_url in state.doctors_missing_summary():
+                if doctor_id not in submitted:
+                    profile = state.get_profile(profile_url) if profile_url else None
+                    if profile and profile['patient_stories']:
+                        summary_pipeline.submit(doctor_id, profile['patient_stories'])
+            for doctor_info in state.update_summaries(summary_pipeline.join()):
+                if exporter:
+                    exporter.append(doctor_info)
+        
+        if change_tracker:
+            # Snapshots are taken once summaries are in, so the next run can reuse them
+            state.save_snapshots(change_tracker.fingerprints)
+            removed = state.remove_missing_snapshots()
+            change_tracker.write_report(change_report_path, removed)
+            for status, count in change_tracker.report(removed)['counts'].items():
+                metrics.count(f'doctors_{status}', count)
+        
+        # Export from the store in task order so the output does not depend on worker scheduling
+        return state.load_doctors(tasks)
+    finally:
+        if fetcher:
+            fetcher.close()
+        if summary_pipeline:
+            summary_pipeline.close()
+        if summary_cache:
+            cache_stats = summary_cache.stats()
+            metrics.count('summary_cache_hits', cache_stats['hits'])
+            metrics.count('summary_cache_misses', cache_stats['misses'])
+            summary_cache.close()
+        state.close()
@@ -0,0 +1,118 @@
+import json, os, threading
+
+class SelectorRegistry:
+    """Ordered extraction strategies per field, reordered by how well they currently work
+
+    Each field is registered with a default ordered list of (name, strategy) pairs. Every
+    attempt is counted per strategy; strategies are then tried by smoothed success rate, so
+    the one that currently works moves to the front. Counts can be persisted across runs.
+
+    Only strategies of equal precision may be reordered. Heuristic fallbacks that accept
+    almost anything are registered separately and always run last, in declared order: they
+    only run after the precise ones missed, so their hit rate is conditional and says
+    nothing about whether what they returned was right.
+    """
+
+    def __init__(self):
+        self.fields = {}
+        self.fallbacks = {}
+        self.stats = {}
+        self.field_stats = {}
+        self.lock = threading.Lock()
+
+    def register(self, field, strategies, fallbacks=()):
+        """Declare the default ordered strategies for a field, plus heuristic fallbacks pinned to the end"""
+        with self.lock:
+            self.fields[field] = list(strategies)
+            self.fallbacks[field] = list(fallbacks)
+            self.stats.setdefault(field, {})
+            self.field_stats.setdefault(field, {'attempts': 0, 'successes': 0})
+
+    def score(self, field, name):
+        counts = self.stats.get(field, {}).get(name, {'attempts': 0, 'successes': 0})
+        # Laplace smoothing: untried strategies sit at 0.5, between working and broken ones
+        return (counts['successes'] + 1) / (counts['attempts'] + 2)
+
+    def ordered(self, field):
+        """Strategies of a field, best current success rate first (ties keep the declared order), then the fallbacks"""
+        with self.lock:
+            strategies = self.fields[field]
+            return sorted(strategies, key=lambda item: -self.score(field, item[0])) + self.fallbacks[field]
+
+    def record(self, field, name, success):
+        with self.lock:
+            counts = self.stats.setdefault(field, {}).setdefault(name, {'attempts': 0, 'successes': 0})
+            counts['attempts'] += 1
+            counts['successes'] += int(bool(success))
+
+    def record_field(self, field, success):
+        with self.lock:
+            counts = self.field_stats.setdefault(field, {'attempts': 0, 'successes': 0})
+            counts['attempts'] += 1
+            counts['successes'] += int(bool(success))
+
+    def record_chain(self, field, ordered_names, winner):
+        """Record an attempt made elsewhere (e.g. in the browser): names before the winner failed"""
+        for name in ordered_names:
+            self.record(field, name, name == winner)
+            if name == winner:
+                break
+        self.record_field(field, winner in ordered_names)
+
+    def first_match(self, field, apply, default=""):
+        """Try the field's strategies in adaptive order, apply(strategy) returning a value or a falsy miss"""
+        for name, strategy in self.ordered(field):
+            try:
+                value = apply(strategy)
+            except Exception as e:
+                value = None
+            self.record(field, name, value)
+            if value:
+                self.record_field(field, True)
+                return value
+        self.record_field(field, False)
+        return default
+
+    def report(self):
+        """Per-field success rates plus per-strategy counts in current order"""
+        report = {}
+        for field in sorted(self.fields):
+            order = [name for name, _ in self.ordered(field)]
+            with self.lock:
+                field_counts = dict(self.field_stats.get(field, {'attempts': 0, 'successes': 0}))
+                strategies = {name: dict(self.stats[field].get(name, {'attempts': 0, 'successes': 0})) for name in order}
+            attempts = field_counts['attempts']
+            report[field] = {
+                'attempts': attempts,
+                'successes': field_counts['successes'],
+                'success_rate': round(field_counts['successes'] / attempts, 3) if attempts else None,
+                'order': order,
+                'strategies': strategies
+            }
+        return report
+
+    def load(self, path):
+        """Merge persisted counts from an earlier run"""
+        if not path or not os.path.exists(path):
+            return
+        try:
+            with open(path, encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        with self.lock:
+            for field, data in saved.items():
+                self.field_stats[field] = {'attempts': data.get('attempts', 0), 'successes': data.get('successes', 0)}
+                self.stats[field] = {
+                    name: {'attempts': counts.get('attempts', 0), 'successes': counts.get('successes', 0)}
+                    for name, counts in data.get('strategies', {}).items()
+                }
+
+    def save(self, path):
+        if not path:
+            return
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+
+# Shared by the parser, the browser scraper and the CLI
+registry = SelectorRegistry()
@@ -0,0 +1,54 @@
+"""ProfileFetcher against a local stand-in server serving the synthetic fixtures"""
+import pytest
+
+from doctor_scraper.benchmark import FixtureServer, synthetic_fixtures, PRACTO_ORIGIN
+from doctor_scraper.html_archive import HtmlArchive
+from doctor_scraper.http_fetcher import ProfileFetcher
+
+@pytest.fixture
+def fixtures():
+    return synthetic_fixtures(doctors_per_combination=3, specialties=["Cardiologist"], regions=["Aundh"])
+
+@pytest.fixture
+def server(fixtures):
+    server = FixtureServer(fixtures).start()
+    yield server
+    server.close()
+
+@pytest.fixture
+def fetcher(server):
+    fetcher = ProfileFetcher(concurrency=2, base_url=server.base_url, retries=0)
+    yield fetcher
+    fetcher.close()
+
+def profile_urls(fixtures):
+    return [PRACTO_ORIGIN + path for path in fixtures.profiles]
+
+def test_fetch_profile_through_base_url(fixtures, fetcher):
+    profile = fetcher.fetch_profile(profile_urls(fixtures)[0])
+
+    assert profile['complete_address'] == "0 Main Road, Aundh, Pune, Maharashtra 411000"
+    assert len(profile['patient_stories']) >= 2
+
+def test_fetch_profiles_concurrently_over_one_pool(fixtures, server, fetcher):
+    urls = profile_urls(fixtures)
+    profiles = fetcher.fetch_profiles(urls + urls[:1])
+
+    # Duplicates are fetched once
+    assert list(profiles) == urls
+    assert server.requests_served == len(urls)
+    assert all(profile['complete_address'] for profile in profiles.values())
+
+def test_missing_profile_is_none(fetcher):
+    assert fetcher.fetch_profile(PRACTO_ORIGIN + "/pune/doctor/nobody") is None
+
+def test_fetched_pages_are_archived(fixtures, server, tmp_path):
+    archive = HtmlArchive(str(tmp_path / "archive.sqlite"))
+    fetcher = ProfileFetcher(base_url=server.base_url, retries=0, archive=archive)
+    try:
+        url = profile_urls(fixtures)[0]
+        fetcher.fetch_profile(url)
+        assert "clinic-address" in archive.latest_profile(url)
+    finally:
+        fetcher.close()
+        archive.close()
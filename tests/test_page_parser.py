@@ -0,0 +1,62 @@
+"""Offline parsing of saved card, search and profile HTML, no browser involved"""
+from pathlib import Path
+
+from doctor_scraper.page_parser import build_doctor_info, parse_card, parse_card_html, parse_profile, parse_search_page
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+def read_fixture(name):
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+def test_card_fields():
+    doctor_info = parse_card(read_fixture("card.html"))
+
+    assert doctor_info['doctors_name'] == "Dr. Asha Kulkarni"
+    assert doctor_info['specialty'] == "Cardiologist"
+    assert doctor_info['years_of_experience'] == "18 years"
+    assert doctor_info['clinic_hospital'] == "Ruby Hall Clinic"
+    assert doctor_info['ratings'] == "96%"
+    assert doctor_info['reviews'] == "212 Patient Stories"
+    assert doctor_info['complete_address'] == "Aundh, Pune"
+    assert doctor_info['contact_email'].endswith("@gmail.com")
+
+def test_card_profile_url_is_absolute():
+    card_data = parse_card_html(read_fixture("card.html"))
+
+    assert card_data['profile_url'] == "https://www.practo.com/pune/doctor/dr-asha-kulkarni-cardiologist"
+
+def test_embedded_phone_from_repeated_candidates():
+    # The same number as tel: link and revealed text must not be read as one long digit run
+    assert parse_card_html(read_fixture("card.html"))['embedded_phone'] == "9876543210"
+
+def test_search_page_cards():
+    cards = [build_doctor_info(card_data) for card_data in parse_search_page(read_fixture("search_page.html"))]
+
+    assert [card['doctors_name'] for card in cards] == ["Dr. Rohan Mehta", "Dr. Neha Joshi"]
+    assert cards[0]['complete_address'] == "12 Baner Road, Pune"
+    assert cards[1]['clinic_hospital'] == "Baner Derma Care"
+
+def test_profile_address_and_stories():
+    profile = parse_profile(read_fixture("profile.html"))
+
+    assert profile['complete_address'] == "14 ITI Road, Aundh, Pune, Maharashtra 411007"
+    assert profile['patient_stories'] == [
+        "Explained the angiography results patiently and clearly.",
+        "Long waiting time, but the treatment worked well."
+    ]
+
+def test_review_elements_win_after_profiles_without_reviews():
+    # The generic text fallback matches these pages, it must not be promoted past review-text
+    for _ in range(5):
+        parse_profile("<html><body><div>Find a doctor near you and book your treatment online</div></body></html>")
+
+    assert parse_profile(read_fixture("profile.html"))['patient_stories'][0].startswith("Explained")
+
+def test_clinic_selector_wins_after_cards_without_it():
+    for _ in range(5):
+        build_doctor_info({'clinic_candidates': ["View all 3 clinics"]})
+
+    assert parse_card(read_fixture("card.html"))['clinic_hospital'] == "Ruby Hall Clinic"
+
+def test_unparseable_profile_is_empty():
+    assert parse_profile("") == {'complete_address': '', 'patient_stories': []}
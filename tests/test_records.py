@@ -0,0 +1,84 @@
+"""DoctorRecord and ColumnStore round-trips"""
+import json, pickle
+
+import pytest
+
+from doctor_scraper.crawl_state import CrawlState
+from doctor_scraper.excel_export import save_to_excel
+from doctor_scraper.records import FIELDS, ColumnStore, DoctorRecord
+
+def make_record(**values):
+    defaults = {
+        'doctors_name': "Dr. Asha Kulkarni",
+        'specialty': "Cardiologist",
+        'complete_address': "14 ITI Road, Aundh, Pune",
+        'contact_number': "9876543210",
+        'region': "Aundh",
+        'profile_url': "https://www.practo.com/pune/doctor/dr-asha-kulkarni"
+    }
+    return DoctorRecord(**dict(defaults, **values))
+
+def test_record_behaves_like_a_dict():
+    record = make_record()
+    record['summary_pros_cons'] = "Caring."
+
+    assert record['doctors_name'] == "Dr. Asha Kulkarni"
+    assert record.get('ratings') == ''
+    assert record.get('not_a_field', 'default') == 'default'
+    assert list(dict(record)) == list(FIELDS)
+    with pytest.raises(KeyError):
+        record['not_a_field']
+    with pytest.raises(TypeError):
+        DoctorRecord(not_a_field="x")
+
+def test_record_json_and_pickle_round_trip():
+    record = make_record()
+
+    assert DoctorRecord.from_dict(json.loads(json.dumps(dict(record)))) == record
+    assert pickle.loads(pickle.dumps(record)) == record
+    assert record == dict(record)
+
+def test_record_from_dict_drops_unknown_fields():
+    assert DoctorRecord.from_dict({'doctors_name': "Dr. X", 'legacy': 1}) == DoctorRecord(doctors_name="Dr. X")
+
+def test_crawl_state_round_trip(tmp_path):
+    state = CrawlState(str(tmp_path / "state.sqlite"))
+    try:
+        state.complete_task("Aundh", "Cardiologist", [make_record()])
+        doctors = state.load_doctors()
+    finally:
+        state.close()
+
+    assert doctors == [make_record()]
+    assert isinstance(doctors[0], DoctorRecord)
+
+def test_column_store_columns():
+    store = ColumnStore.from_records([make_record(), {'doctors_name': "Dr. Y", 'ratings': None}])
+
+    assert len(store) == 2
+    assert store.columns['doctors_name'] == ["Dr. Asha Kulkarni", "Dr. Y"]
+    # Missing and None values become '' so every column stays text
+    assert store.columns['ratings'] == ['', '']
+
+def test_column_store_to_pandas_and_arrow():
+    store = ColumnStore.from_records([make_record(), make_record(doctors_name="Dr. Y", profile_url="")])
+
+    df = store.to_pandas()
+    assert list(df.columns) == list(FIELDS)
+    assert df['doctors_name'].tolist() == ["Dr. Asha Kulkarni", "Dr. Y"]
+
+    table = store.to_arrow()
+    assert table.column_names == list(FIELDS)
+    assert table.column('doctors_name').to_pylist() == ["Dr. Asha Kulkarni", "Dr. Y"]
+
+def test_save_to_excel_merges_duplicates_and_drops_incomplete(tmp_path):
+    records = [
+        make_record(),
+        make_record(region="Baner"),
+        make_record(doctors_name="Dr. No Phone", contact_number="", profile_url="")
+    ]
+    df = save_to_excel(ColumnStore.from_records(records), filename=str(tmp_path / "out.xlsx"))
+
+    assert df['doctors_name'].tolist() == ["Dr. Asha Kulkarni"]
+    assert df['region'].tolist() == ["Aundh, Baner"]
+    assert (tmp_path / "out.xlsx").exists()
@@ -0,0 +1,116 @@
+"""Summary pipeline and batched summaries with a stubbed model client, no API calls"""
+import threading
+
+from doctor_scraper.benchmark import StubGeminiModel, StubResponse
+from doctor_scraper.gemini_service import SummaryCache, SummaryPipeline, generate_summaries_batch
+
+STORIES = [
+    ["Explained the diagnosis clearly and was very caring."],
+    ["Long waiting time, but the treatment worked."],
+    ["Friendly staff and a patient doctor."],
+    ["Rushed consultation, did not answer questions."],
+    ["Surgery went well, quick recovery."]
+]
+
+class ConcurrencyStub(StubGeminiModel):
+    """Records the most requests that were running at the same time"""
+
+    def __init__(self, latency):
+        super().__init__(latency)
+        self.running = 0
+        self.max_running = 0
+        self.running_lock = threading.Lock()
+
+    def generate_content(self, prompt):
+        with self.running_lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            return super().generate_content(prompt)
+        finally:
+            with self.running_lock:
+                self.running -= 1
+
+class NoJsonStub(StubGeminiModel):
+    """Answers batch prompts with something that is not JSON"""
+
+    def generate_content(self, prompt):
+        if "JSON array" in prompt:
+            with self.lock:
+                self.calls += 1
+            return StubResponse("Sorry, here are the summaries in prose.")
+        return super().generate_content(prompt)
+
+def run_pipeline(model, **kwargs):
+    pipeline = SummaryPipeline(model_client=model, **kwargs)
+    try:
+        for position, patient_stories in enumerate(STORIES):
+            pipeline.submit(("Aundh", "Cardiologist", position), patient_stories)
+        return pipeline.join()
+    finally:
+        pipeline.close()
+
+def test_summaries_joined_by_doctor_id():
+    model = StubGeminiModel()
+    summaries = run_pipeline(model, max_in_flight=2)
+
+    assert sorted(summaries) == [("Aundh", "Cardiologist", position) for position in range(len(STORIES))]
+    assert all(summary.startswith("Patients value") for summary in summaries.values())
+    assert model.calls == len(STORIES)
+
+def test_in_flight_requests_are_bounded():
+    model = ConcurrencyStub(latency=0.05)
+    run_pipeline(model, max_in_flight=2)
+
+    assert model.max_running == 2
+
+def test_batched_submissions_share_requests():
+    model = StubGeminiModel()
+    summaries = run_pipeline(model, max_in_flight=2, batch_size=3)
+
+    assert len(summaries) == len(STORIES)
+    assert model.calls == 2
+
+def test_cached_summaries_skip_the_model(tmp_path):
+    cache = SummaryCache(str(tmp_path / "cache.sqlite"))
+    try:
+        run_pipeline(StubGeminiModel(), cache=cache)
+        model = StubGeminiModel()
+        summaries = run_pipeline(model, cache=cache)
+    finally:
+        cache.close()
+
+    assert len(summaries) == len(STORIES)
+    assert model.calls == 0
+
+def test_discarded_attempt_does_not_overwrite_its_retry():
+    model = StubGeminiModel(latency=0.05)
+    pipeline = SummaryPipeline(max_in_flight=1, model_client=model)
+    try:
+        for position, patient_stories in enumerate(STORIES[:3]):
+            pipeline.submit(("Aundh", "Cardiologist", position), patient_stories)
+        pipeline.discard([("Aundh", "Cardiologist", 1), ("Aundh", "Cardiologist", 2)])
+        pipeline.submit(("Aundh", "Cardiologist", 1), STORIES[3])
+        summaries = pipeline.join()
+    finally:
+        pipeline.close()
+
+    assert sorted(summaries) == [("Aundh", "Cardiologist", 0), ("Aundh", "Cardiologist", 1)]
+    # The discarded request that had not started yet was never sent
+    assert model.calls == 2
+
+def test_batch_keeps_order_and_skips_empty_story_lists():
+    model = StubGeminiModel()
+    summaries = generate_summaries_batch([STORIES[0], [], STORIES[1]], model)
+
+    assert summaries[1] == "No patient stories available for summary."
+    assert summaries[0].startswith("Patients value") and summaries[2].startswith("Patients value")
+    assert model.calls == 1
+
+def test_batch_falls_back_per_doctor_on_unparseable_response():
+    model = NoJsonStub()
+    summaries = generate_summaries_batch(STORIES[:2], model)
+
+    assert all(summary.startswith("Patients value") for summary in summaries)
+    # One failed batch request, then one request per doctor
+    assert model.calls == 3